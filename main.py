@@ -23,7 +23,7 @@ pygame.init()
 
 # Game parameters
 running = True
-maze = dfs.create()
+maze = dfs.generate()
 
 while running:
     # Handle user input
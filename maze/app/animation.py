@@ -0,0 +1,111 @@
+"""
+Maze animation.
+
+This module displays the carve steps of a maze generator and the paths found by solvers on the pygame screen.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+from maze.app.consts import N_ROWS, N_COLS, FREE_CELL, SHIFTS
+from maze.app.visualizer import drawMaze, drawPath
+from maze.app.bitmask import ALL_WALLS
+from maze.generation.grid import lattice, placeMouseAndCheese
+import numpy as np
+import pygame
+
+def animate(screen, clock, carve, fps, steps_per_frame=1, seed=None):
+    """
+    Create a maze and display its generation step-by-step.
+
+    Args:
+        screen (pygame.Surface): Screen to draw maze.
+        clock (pygame.time.Clock): Clock controls the frame rate.
+        carve (callable): Carving engine of a generator, e.g. `maze.generation.dfs.carve`.
+        fps (int): Number of frames per second.
+        steps_per_frame (int, optional): Number of carve steps applied between frames. Defaults to 1.
+        seed (int, optional): Seed of the random generator. Defaults to None.
+
+    Returns:
+        np.ndarray: 2D array representing the maze, or None if the user closed the window.
+    """
+    # Initialize maze
+    maze = placeMouseAndCheese(lattice(N_ROWS, N_COLS))
+    walls = np.full((N_ROWS // 2, N_COLS // 2), ALL_WALLS, dtype=np.uint8)
+    width = N_COLS // 2
+
+    # Display maze
+    if not __drawFrame(screen, clock, maze, fps):
+        return
+
+    for step, (cell, move) in enumerate(carve(walls, seed), start=1):
+        # Remove the wall from the grid
+        row, col = divmod(cell, width)
+        d_row, d_col = SHIFTS[move]
+        maze[2*row + 1 + d_row][2*col + 1 + d_col] = FREE_CELL
+
+        # Display maze
+        if step % steps_per_frame == 0 and not __drawFrame(screen, clock, maze, fps):
+            return
+
+    # Display final maze
+    if not __drawFrame(screen, clock, maze, fps):
+        return
+    return maze
+
+def __drawFrame(screen, clock, maze, fps):
+    """
+    Draw the maze and wait for the next frame.
+
+    Args:
+        screen (pygame.Surface): Screen to draw maze.
+        clock (pygame.time.Clock): Clock controls the frame rate.
+        maze (np.ndarray): 2D array representing the maze.
+        fps (int): Number of frames per second.
+
+    Returns:
+        bool: False if the user closed the window.
+    """
+    # Handle user input
+    for event in pygame.event.get():
+        # Close window
+        if event.type == pygame.QUIT:
+            return False
+
+    drawMaze(screen, maze)
+    pygame.display.flip()
+    clock.tick(fps)
+    return True
+
+def animatePath(screen, clock, maze, path, fps):
+    """
+    Display the path arrow by arrow from the start to the goal.
+
+    Args:
+        screen (pygame.Surface): Screen to draw maze.
+        clock (pygame.time.Clock): Clock controls the frame rate.
+        maze (np.ndarray): 2D array representing the maze.
+        path (maze.solution.path.Path): Path from the start to the goal.
+        fps (int): Number of frames per second.
+
+    Returns:
+        bool: False if the user closed the window.
+    """
+    grid = path.toGrid()
+    shown = np.full(maze.shape, None)
+    n_cols = maze.shape[1]
+
+    for cell in path.cells[1:-1]:
+        row, col = divmod(int(cell), n_cols)
+        shown[row][col] = grid[row][col]
+
+        # Handle user input
+        for event in pygame.event.get():
+            # Close window
+            if event.type == pygame.QUIT:
+                return False
+
+        drawPath(screen, maze, shown)
+        pygame.display.flip()
+        clock.tick(fps)
+
+    return True
@@ -0,0 +1,87 @@
+"""
+Maze wall bitmasks.
+
+This module contains a compact maze representation. Every logical cell stores its four walls
+as bits of a single byte, where the bit `1 << move` is set if the wall in direction `move`
+(UP, DOWN, LEFT, RIGHT) is present. A maze of n x n cells takes n*n bytes instead of
+(2n+1)*(2n+1) floats.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+from maze.app.consts import FREE_CELL, CHEESE, MOUSE, WALL, UP, DOWN, LEFT, RIGHT
+import numpy as np
+
+# Cell with all four walls
+ALL_WALLS = (1 << UP) | (1 << DOWN) | (1 << LEFT) | (1 << RIGHT)
+
+def opposite(move):
+    """
+    Return the opposite movement (UP <-> DOWN, LEFT <-> RIGHT).
+
+    Args:
+        move (int): Movement direction.
+
+    Returns:
+        int: Opposite movement direction.
+    """
+    return move ^ 1
+
+def isOpen(walls, row, col, move):
+    """
+    Check whether there is no wall in the given direction.
+
+    Args:
+        walls (np.ndarray): 2D array of wall bitmasks.
+        row (int): Cell row.
+        col (int): Cell column.
+        move (int): Movement direction.
+
+    Returns:
+        bool: True if the cell can be left in the given direction.
+    """
+    return not walls[row][col] & (1 << move)
+
+def encode(maze):
+    """
+    Convert a maze grid to wall bitmasks.
+
+    The walls are read through strided views of the grid, so no copy of the maze is made.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+
+    Returns:
+        np.ndarray: 2D uint8 array of shape (n_rows//2, n_cols//2) with wall bitmasks.
+    """
+    rows = maze[0::2, 1::2] == WALL # Walls above and below cells
+    cols = maze[1::2, 0::2] == WALL # Walls left and right of cells
+
+    walls = rows[:-1].astype(np.uint8) << UP
+    walls |= rows[1:].astype(np.uint8) << DOWN
+    walls |= cols[:, :-1].astype(np.uint8) << LEFT
+    walls |= cols[:, 1:].astype(np.uint8) << RIGHT
+    return walls
+
+def decode(walls):
+    """
+    Convert wall bitmasks to a maze grid with the mouse and the cheese.
+
+    Args:
+        walls (np.ndarray): 2D array of wall bitmasks.
+
+    Returns:
+        np.ndarray: 2D array representing the maze.
+    """
+    height, width = walls.shape
+    maze = np.full((2*height + 1, 2*width + 1), WALL, dtype=np.float32)
+    maze[1::2, 1::2] = FREE_CELL
+
+    # Open passages below and right of cells
+    maze[2:-1:2, 1::2][(walls[:-1] & (1 << DOWN)) == 0] = FREE_CELL
+    maze[1::2, 2:-1:2][(walls[:, :-1] & (1 << RIGHT)) == 0] = FREE_CELL
+
+    # Place mouse and cheese
+    maze[1][1] = MOUSE
+    maze[-2][-2] = CHEESE
+    return maze
@@ -22,6 +22,9 @@ DOWN = 1
 LEFT = 2
 RIGHT = 3
 
+# Row and column change of every movement
+SHIFTS = {UP: (-1, 0), DOWN: (1, 0), LEFT: (0, -1), RIGHT: (0, 1)}
+
 # Image paths
 MAZE_IMG_PATH = './assets/image/maze.png'
 CHEESE_IMG_PATH = './assets/image/cheese.png'
@@ -34,6 +37,9 @@ RIGHT_ARROW_IMG = './assets/image/right-arrow.png'
 # Other parameters
 INF = 1_000_000_000
 
+# Directory of saved Q-tables
+QTABLE_DIR = './qtables'
+
 # Frames per seconds
 DFS_FPS = 10
 KRUSKAL_FPS = 20
@@ -6,7 +6,7 @@ This module contains basic mode handler methods.
 Author: Michał Zientek
 Date: 2025-08-25
 """
-from maze.app.consts import FPS, N_COLS, TILE_SIZE, N_ROWS
+from maze.app.consts import FPS, N_COLS, TILE_SIZE, N_ROWS, DFS_FPS, KRUSKAL_FPS, PRIM_FPS
 import maze.generation.dfs as dfs
 import maze.generation.kruskal as kruskal
 import maze.generation.prim as prim
@@ -15,6 +15,7 @@ import maze.solution.astar as astar
 import maze.solution.qlearning as qlearning
 
 import maze.app.visualizer as visual
+import maze.app.animation as animation
 import pygame
 
 class QuitFromAppException(Exception):
@@ -108,7 +109,7 @@ def generateMaze(screen, clock):
                 
                 # Use dfs
                 elif event.key == pygame.K_0:
-                    maze = dfs.create(screen, clock)
+                    maze = animation.animate(screen, clock, dfs.carve, DFS_FPS)
                     if maze is None:
                         raise QuitFromAppException()
                     pause(screen, clock)
@@ -116,7 +117,7 @@ def generateMaze(screen, clock):
                 
                 # Use kruksal
                 elif event.key == pygame.K_1:
-                    maze = kruskal.create(screen, clock)
+                    maze = animation.animate(screen, clock, kruskal.carve, KRUSKAL_FPS)
                     if maze is None:
                         raise QuitFromAppException()
                     pause(screen, clock)
@@ -124,7 +125,7 @@ def generateMaze(screen, clock):
                 
                 # Use prim
                 elif event.key == pygame.K_2:
-                    maze = prim.create(screen, clock)
+                    maze = animation.animate(screen, clock, prim.carve, PRIM_FPS)
                     if maze is None:
                         raise QuitFromAppException()
                     pause(screen, clock)
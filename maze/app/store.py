@@ -0,0 +1,275 @@
+"""
+Maze storage.
+
+This module stores mazes on disk in tiles and reads them back through `numpy.memmap`, so mazes
+larger than the memory can be written and read in pieces, and reopened without regenerating them.
+
+The file starts with a fixed size header followed by the raw tiles. Tiles are stored one after
+another in row-major order, and every tile holds `tile_rows x tile_cols` cells in row-major order.
+Tiles on the bottom and right edges are padded with walls.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+from maze.app.consts import WALL
+import numpy as np
+import struct
+
+# File header: magic, version, dtype, rows, columns, tile rows, tile columns
+MAGIC = b'MAZE'
+VERSION = 1
+HEADER = struct.Struct('<4sH8sQQII')
+HEADER_SIZE = 64
+
+# Default tile size
+TILE_SIZE = 256
+
+class MazeStore:
+    """
+    Maze stored on disk in tiles.
+
+    Attributes:
+        path (str): Path of the file.
+        shape (tuple): (n_rows, n_cols) of the maze.
+        tile_shape (tuple): (tile_rows, tile_cols) of every tile.
+        dtype (np.dtype): Type of the cells.
+        tiles (np.memmap): 4D array of shape (rows of tiles, columns of tiles, tile_rows, tile_cols).
+    """
+
+    def __init__(self, path, shape, tile_shape, dtype, mode):
+        """
+        Map an existing maze file, use `create` or `open` instead.
+
+        Args:
+            path (str): Path of the file.
+            shape (tuple): (n_rows, n_cols) of the maze.
+            tile_shape (tuple): (tile_rows, tile_cols) of every tile.
+            dtype (np.dtype): Type of the cells.
+            mode (str): File mode of `numpy.memmap` ('r', 'r+' or 'w+').
+        """
+        self.path = path
+        self.shape = tuple(shape)
+        self.tile_shape = tuple(tile_shape)
+        self.dtype = np.dtype(dtype)
+
+        n_rows, n_cols = self.shape
+        tile_rows, tile_cols = self.tile_shape
+        grid = (-(-n_rows // tile_rows), -(-n_cols // tile_cols), tile_rows, tile_cols)
+        self.tiles = np.memmap(path, dtype=self.dtype, mode=mode, offset=HEADER_SIZE, shape=grid)
+
+    @classmethod
+    def create(cls, path, shape, tile_shape=(TILE_SIZE, TILE_SIZE), dtype=np.float32):
+        """
+        Create a new maze file filled with walls.
+
+        Args:
+            path (str): Path of the file.
+            shape (tuple): (n_rows, n_cols) of the maze.
+            tile_shape (tuple, optional): (tile_rows, tile_cols) of every tile. Defaults to 256x256.
+            dtype (np.dtype, optional): Type of the cells. Defaults to np.float32.
+
+        Returns:
+            MazeStore: Store opened for reading and writing.
+        """
+        dtype = np.dtype(dtype)
+        header = HEADER.pack(MAGIC, VERSION, dtype.str.encode(), *shape, *tile_shape)
+        with open(path, 'wb') as file:
+            file.write(header.ljust(HEADER_SIZE, b'\0'))
+
+        # New file is filled with zeros
+        store = cls(path, shape, tile_shape, dtype, 'r+')
+        if WALL:
+            store.tiles[:] = WALL
+        return store
+
+    @classmethod
+    def open(cls, path, mode='r'):
+        """
+        Open an existing maze file, only the header is read.
+
+        Args:
+            path (str): Path of the file.
+            mode (str, optional): 'r' for reading, 'r+' for reading and writing. Defaults to 'r'.
+
+        Returns:
+            MazeStore: Opened store.
+
+        Raises:
+            ValueError: If the file is not a maze file.
+        """
+        with open(path, 'rb') as file:
+            header = file.read(HEADER_SIZE)
+
+        if len(header) < HEADER.size:
+            raise ValueError(f'{path} is not a maze file')
+        magic, version, dtype, n_rows, n_cols, tile_rows, tile_cols = HEADER.unpack_from(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} is not a maze file')
+
+        return cls(path, (n_rows, n_cols), (tile_rows, tile_cols), dtype.rstrip(b'\0').decode(), mode)
+
+    @classmethod
+    def fromArray(cls, path, maze, tile_shape=(TILE_SIZE, TILE_SIZE)):
+        """
+        Save a maze to a new file.
+
+        Args:
+            path (str): Path of the file.
+            maze (np.ndarray): 2D array representing the maze.
+            tile_shape (tuple, optional): (tile_rows, tile_cols) of every tile. Defaults to 256x256.
+
+        Returns:
+            MazeStore: Store opened for reading and writing.
+        """
+        store = cls.create(path, maze.shape, tile_shape, maze.dtype)
+        store.write(0, 0, maze)
+        return store
+
+    @classmethod
+    def fromRows(cls, path, rows, shape, tile_shape=(TILE_SIZE, TILE_SIZE), dtype=np.float32):
+        """
+        Save a maze given row by row to a new file, e.g. from `maze.generation.eller.rows`.
+
+        Only one band of tiles is kept in memory at a time.
+
+        Args:
+            path (str): Path of the file.
+            rows (iterable): 1D arrays of length `n_cols`.
+            shape (tuple): (n_rows, n_cols) of the maze.
+            tile_shape (tuple, optional): (tile_rows, tile_cols) of every tile. Defaults to 256x256.
+            dtype (np.dtype, optional): Type of the cells. Defaults to np.float32.
+
+        Returns:
+            MazeStore: Store opened for reading and writing.
+        """
+        store = cls.create(path, shape, tile_shape, dtype)
+        band = np.empty((tile_shape[0], shape[1]), dtype=dtype)
+        top, filled = 0, 0
+
+        for row in rows:
+            band[filled] = row
+            filled += 1
+
+            # Band of tiles is complete
+            if filled == len(band):
+                store.write(top, 0, band)
+                top, filled = top + filled, 0
+
+        if filled:
+            store.write(top, 0, band[:filled])
+        store.flush()
+        return store
+
+    def read(self, row, col, n_rows, n_cols):
+        """
+        Read a rectangular part of the maze.
+
+        Args:
+            row (int): First row.
+            col (int): First column.
+            n_rows (int): Number of rows.
+            n_cols (int): Number of columns.
+
+        Returns:
+            np.ndarray: 2D array with the cells.
+
+        Raises:
+            ValueError: If the rectangle does not lie inside the maze.
+        """
+        self.__check(row, col, n_rows, n_cols)
+        block = np.empty((n_rows, n_cols), dtype=self.dtype)
+
+        for t_row, t_col, dst, src in self.__overlap(row, col, n_rows, n_cols):
+            block[dst] = self.tiles[t_row, t_col][src]
+        return block
+
+    def write(self, row, col, block):
+        """
+        Write a rectangular part of the maze.
+
+        Args:
+            row (int): First row.
+            col (int): First column.
+            block (np.ndarray): 2D array with the cells.
+
+        Raises:
+            ValueError: If the block does not lie inside the maze, nothing is written then.
+        """
+        n_rows, n_cols = block.shape
+        self.__check(row, col, n_rows, n_cols)
+        for t_row, t_col, src, dst in self.__overlap(row, col, n_rows, n_cols):
+            self.tiles[t_row, t_col][dst] = block[src]
+
+    def tile(self, t_row, t_col):
+        """
+        Return a tile without copying it, padding cells included.
+
+        Args:
+            t_row (int): Row of the tile.
+            t_col (int): Column of the tile.
+
+        Returns:
+            np.memmap: 2D array of shape `tile_shape`.
+        """
+        return self.tiles[t_row, t_col]
+
+    def toArray(self):
+        """
+        Read the whole maze into memory.
+
+        Returns:
+            np.ndarray: 2D array representing the maze.
+        """
+        return self.read(0, 0, *self.shape)
+
+    def flush(self):
+        """
+        Write pending changes to the disk.
+        """
+        self.tiles.flush()
+
+    def __check(self, row, col, n_rows, n_cols):
+        """
+        Make sure a rectangle lies inside the maze, negative indices are not wrapped around.
+
+        Args:
+            row (int): First row.
+            col (int): First column.
+            n_rows (int): Number of rows.
+            n_cols (int): Number of columns.
+
+        Raises:
+            ValueError: If the rectangle does not lie inside the maze.
+        """
+        if (row < 0 or col < 0 or n_rows < 0 or n_cols < 0
+                or row + n_rows > self.shape[0] or col + n_cols > self.shape[1]):
+            raise ValueError(f'Rectangle of {n_rows}x{n_cols} cells at ({row}, {col}) '
+                             f'does not fit in the maze of shape {self.shape}')
+
+    def __overlap(self, row, col, n_rows, n_cols):
+        """
+        Find the parts of tiles covered by a rectangle.
+
+        Args:
+            row (int): First row.
+            col (int): First column.
+            n_rows (int): Number of rows.
+            n_cols (int): Number of columns.
+
+        Yields:
+            tuple: (t_row, t_col, rect, part) tile index, slices of the rectangle and slices of the tile.
+        """
+        tile_rows, tile_cols = self.tile_shape
+
+        for t_row in range(row // tile_rows, (row + n_rows - 1) // tile_rows + 1):
+            top = max(row, t_row*tile_rows)
+            bottom = min(row + n_rows, (t_row + 1)*tile_rows)
+
+            for t_col in range(col // tile_cols, (col + n_cols - 1) // tile_cols + 1):
+                left = max(col, t_col*tile_cols)
+                right = min(col + n_cols, (t_col + 1)*tile_cols)
+
+                rect = (slice(top - row, bottom - row), slice(left - col, right - col))
+                part = (slice(top - t_row*tile_rows, bottom - t_row*tile_rows),
+                        slice(left - t_col*tile_cols, right - t_col*tile_cols))
+                yield t_row, t_col, rect, part
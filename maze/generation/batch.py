@@ -0,0 +1,113 @@
+"""
+Batch maze generation.
+
+This module creates many mazes at once by spreading the work over a pool of processes.
+Every maze gets its own seed derived from a single batch seed, so a whole batch can be reproduced.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+import maze.generation.dfs as dfs
+import maze.generation.kruskal as kruskal
+import maze.generation.prim as prim
+import maze.generation.eller as eller
+import maze.generation.binarytree as binarytree
+import maze.generation.sidewinder as sidewinder
+from multiprocessing import Pool
+import numpy as np
+import os
+
+# Available generators
+ALGORITHMS = {
+    'dfs': dfs.generate,
+    'kruskal': kruskal.generate,
+    'prim': prim.generate,
+    'eller': eller.generate,
+    'binarytree': binarytree.generate,
+    'sidewinder': sidewinder.generate,
+}
+
+def seeds(n, seed=None):
+    """
+    Derive independent seeds for a batch of mazes.
+
+    Args:
+        n (int): Number of seeds.
+        seed (int, optional): Seed of the whole batch. Defaults to None.
+
+    Returns:
+        list: List of `n` integer seeds.
+    """
+    children = np.random.SeedSequence(seed).spawn(n)
+    return [int(child.generate_state(1)[0]) for child in children]
+
+def stream(algorithm, n, size, seed=None, workers=None):
+    """
+    Create mazes in parallel and yield them in order.
+
+    Args:
+        algorithm (str): Name of the generator, one of `ALGORITHMS`.
+        n (int): Number of mazes.
+        size (int | tuple): Number of maze rows and columns, or a single number for square mazes.
+        seed (int, optional): Seed of the whole batch. Defaults to None.
+        workers (int, optional): Number of processes. Defaults to the number of CPUs.
+
+    Yields:
+        np.ndarray: 2D array representing the next maze.
+
+    Raises:
+        ValueError: If the algorithm is unknown.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f'Unknown algorithm {algorithm!r}, expected one of {", ".join(ALGORITHMS)}')
+
+    n_rows, n_cols = (size, size) if isinstance(size, int) else size
+    jobs = [(algorithm, n_rows, n_cols, maze_seed) for maze_seed in seeds(n, seed)]
+    workers = workers or os.cpu_count() or 1
+
+    # Generate in this process
+    if workers == 1:
+        for job in jobs:
+            yield __createMaze(job)
+        return
+
+    # Send jobs in chunks to limit the overhead
+    with Pool(workers) as pool:
+        yield from pool.imap(__createMaze, jobs, chunksize=max(1, n // (4*workers)))
+
+def generate(algorithm, n, size, seed=None, workers=None):
+    """
+    Create a batch of mazes in parallel.
+
+    Args:
+        algorithm (str): Name of the generator, one of `ALGORITHMS`.
+        n (int): Number of mazes.
+        size (int | tuple): Number of maze rows and columns, or a single number for square mazes.
+        seed (int, optional): Seed of the whole batch. Defaults to None.
+        workers (int, optional): Number of processes. Defaults to the number of CPUs.
+
+    Returns:
+        np.ndarray: 3D array of shape (n, n_rows, n_cols) with all mazes.
+
+    Raises:
+        ValueError: If the algorithm is unknown.
+    """
+    n_rows, n_cols = (size, size) if isinstance(size, int) else size
+    mazes = np.empty((n, n_rows, n_cols), dtype=np.float32)
+
+    for i, maze in enumerate(stream(algorithm, n, size, seed, workers)):
+        mazes[i] = maze
+    return mazes
+
+def __createMaze(job):
+    """
+    Create a single maze of the batch.
+
+    Args:
+        job (tuple): (algorithm, n_rows, n_cols, seed)
+
+    Returns:
+        np.ndarray: 2D array representing the maze.
+    """
+    algorithm, n_rows, n_cols, seed = job
+    return ALGORITHMS[algorithm](n_rows, n_cols, seed)
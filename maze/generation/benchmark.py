@@ -0,0 +1,181 @@
+"""
+Maze generation benchmark.
+
+This module times every generator registered in `maze.generation.batch.ALGORITHMS` over a grid of
+maze sizes and seeds, and saves the results as JSON so that runs can be compared to catch regressions.
+
+Usage:
+    python -m maze.generation.benchmark --sizes 101 501 1001 --output results.json
+    python -m maze.generation.benchmark --compare results.json
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+from maze.generation.batch import ALGORITHMS
+import numpy as np
+import argparse
+import platform
+import tracemalloc
+import time
+import json
+import sys
+
+def measure(algorithm, n_rows, n_cols, seed, repeat=3):
+    """
+    Measure a single generator run.
+
+    The time is the best of `repeat` runs. The peak memory is measured in a separate run,
+    because tracing the allocations slows the generator down.
+
+    Args:
+        algorithm (str): Name of the generator, one of `ALGORITHMS`.
+        n_rows (int): Number of maze rows.
+        n_cols (int): Number of maze columns.
+        seed (int): Seed of the random generator.
+        repeat (int, optional): Number of timed runs. Defaults to 3.
+
+    Returns:
+        tuple: (seconds, peak_bytes)
+    """
+    generate = ALGORITHMS[algorithm]
+
+    # Measure time
+    seconds = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        generate(n_rows, n_cols, seed)
+        seconds = min(seconds, time.perf_counter() - start)
+
+    # Measure memory
+    tracemalloc.start()
+    generate(n_rows, n_cols, seed)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return seconds, peak_bytes
+
+def run(algorithms, sizes, n_seeds=3, repeat=3, log=None):
+    """
+    Benchmark generators over all combinations of sizes and seeds.
+
+    Args:
+        algorithms (list): Names of the generators.
+        sizes (list): List of (n_rows, n_cols).
+        n_seeds (int, optional): Number of seeds per size. Defaults to 3.
+        repeat (int, optional): Number of timed runs per seed. Defaults to 3.
+        log (file, optional): Stream for progress messages. Defaults to None.
+
+    Returns:
+        dict: Benchmark report with the environment and one result per algorithm and size.
+    """
+    results = []
+
+    for algorithm in algorithms:
+        for n_rows, n_cols in sizes:
+            n_cells = (n_rows // 2)*(n_cols // 2)
+            runs = [measure(algorithm, n_rows, n_cols, seed, repeat) for seed in range(n_seeds)]
+            seconds = [run_seconds for run_seconds, _ in runs]
+
+            result = {
+                'algorithm': algorithm,
+                'size': [n_rows, n_cols],
+                'seeds': n_seeds,
+                'best_seconds': min(seconds),
+                'mean_seconds': sum(seconds) / len(seconds),
+                'peak_bytes': max(peak_bytes for _, peak_bytes in runs),
+                'cells_per_second': n_cells / min(seconds),
+            }
+            results.append(result)
+
+            if log:
+                print(f'{algorithm:>12} {n_rows}x{n_cols}: {result["best_seconds"]:.4f}s, '
+                      f'{result["peak_bytes"] / 2**20:.1f} MiB, {result["cells_per_second"]:,.0f} cells/s', file=log)
+
+    return {
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'system': platform.system(),
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+def compare(baseline, report, tolerance=0.2):
+    """
+    Find results that got slower or use more memory than the baseline.
+
+    Args:
+        baseline (dict): Earlier benchmark report.
+        report (dict): Current benchmark report.
+        tolerance (float, optional): Allowed relative increase. Defaults to 0.2.
+
+    Returns:
+        list: Descriptions of the regressions.
+    """
+    old = {(result['algorithm'], tuple(result['size'])): result for result in baseline['results']}
+    regressions = []
+
+    for result in report['results']:
+        key = (result['algorithm'], tuple(result['size']))
+        if key not in old:
+            continue
+
+        for metric in ('best_seconds', 'peak_bytes'):
+            before, after = old[key][metric], result[metric]
+            if after > before*(1 + tolerance):
+                regressions.append(f'{key[0]} {key[1][0]}x{key[1][1]}: {metric} {before:.4g} -> {after:.4g}')
+
+    return regressions
+
+def parseSize(text):
+    """
+    Parse maze size given as '101' or '101x51'.
+
+    Args:
+        text (str): Size description.
+
+    Returns:
+        tuple: (n_rows, n_cols)
+    """
+    n_rows, _, n_cols = text.partition('x')
+    return int(n_rows), int(n_cols or n_rows)
+
+def main(argv=None):
+    """
+    Run the benchmark from the command line.
+
+    Args:
+        argv (list, optional): Command line arguments. Defaults to sys.argv.
+
+    Returns:
+        int: Exit code, 1 if regressions were found.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark maze generators.')
+    parser.add_argument('--algorithms', nargs='+', default=list(ALGORITHMS), choices=list(ALGORITHMS))
+    parser.add_argument('--sizes', nargs='+', type=parseSize, default=[(101, 101), (501, 501), (1001, 1001)])
+    parser.add_argument('--seeds', type=int, default=3, help='number of seeds per size')
+    parser.add_argument('--repeat', type=int, default=3, help='number of timed runs per seed')
+    parser.add_argument('--output', help='file to save the results')
+    parser.add_argument('--compare', help='earlier results to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed relative slowdown')
+    args = parser.parse_args(argv)
+
+    report = run(args.algorithms, args.sizes, args.seeds, args.repeat, log=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(json.load(file), report, args.tolerance)
+        for regression in regressions:
+            print(f'Regression: {regression}', file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
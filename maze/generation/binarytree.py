@@ -0,0 +1,53 @@
+"""
+Maze generator using the binary tree algorithm.
+
+This module creates a random maze where every cell opens a passage either north or east.
+The choices are independent, so the whole maze is carved with a few NumPy array operations.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+from maze.app.consts import N_ROWS, N_COLS, FREE_CELL
+from maze.app.bitmask import encode
+from maze.generation.grid import lattice, placeMouseAndCheese
+import numpy as np
+
+def generate(n_rows=N_ROWS, n_cols=N_COLS, seed=None, compact=False):
+    """
+    Create a random maze using the binary tree algorithm.
+
+    Cells in the top row can only go east and cells in the last column can only go north,
+    the top-right cell is the root of the tree.
+
+    Args:
+        n_rows (int, optional): Number of maze rows, must be odd. Defaults to N_ROWS.
+        n_cols (int, optional): Number of maze columns, must be odd. Defaults to N_COLS.
+        seed (int, optional): Seed of the random generator. Defaults to None.
+        compact (bool, optional): Return wall bitmasks instead of the grid. Defaults to False.
+
+    Returns:
+        np.ndarray: 2D array representing the maze, or 2D uint8 array of wall bitmasks if `compact` is set.
+
+    Raises:
+        ValueError: If the maze size is invalid.
+    """
+    # Initialize maze
+    maze = lattice(n_rows, n_cols)
+    height, width = n_rows // 2, n_cols // 2
+    rng = np.random.default_rng(seed)
+
+    # Pick direction of every cell
+    north = rng.integers(0, 2, size=(height, width), dtype=np.bool_)
+    north[0, :] = False
+    north[:, -1] = True
+    north[0, -1] = False
+
+    east = ~north
+    east[:, -1] = False
+
+    # Remove walls
+    maze[0:-1:2, 1::2][north] = FREE_CELL
+    maze[1::2, 2::2][east] = FREE_CELL
+
+    placeMouseAndCheese(maze)
+    return encode(maze) if compact else maze
@@ -2,129 +2,98 @@
 Maze generator using depth-first search (DFS).
 
 This module creates a random maze using a stack-based DFS algorithm.
-It can optionally display the maze generation step-by-step using pygame.
+The generation is split into carve steps, so it can be displayed step-by-step (see `maze.app.animation`).
 
 Author: Michał Zientek
 Date: 2025-08-15
 """
-from maze.app.consts import N_ROWS, N_COLS, FREE_CELL, CHEESE, MOUSE, WALL, UP, DOWN, LEFT, RIGHT, DFS_FPS
-from maze.app.visualizer import drawMaze
-from collections import deque
+from maze.app.consts import N_ROWS, N_COLS, UP, DOWN, LEFT, RIGHT
+from maze.app.bitmask import ALL_WALLS, decode, opposite
+from maze.generation.grid import checkSize
 import numpy as np
 import random
-import pygame
 
-def create(screen=None, clock=None):
+def carve(walls, seed=None):
     """
-    Create a random maze using depth-first search (DFS) with stack.
-    
-    Optionally display maze generation step on pygame screen.
-    
+    Carve a random maze into wall bitmasks using depth-first search (DFS) with stack.
+
+    Cells are identified by flat indices, visited cells are kept in a boolean array and
+    the stack is a preallocated index array, so time and memory grow linearly with the maze.
+
     Args:
-        screen (pygame.Surface, optional): Screen to draw maze. Defaults to None.
-        clock (pygame.time.Clock, optional): Clock controls the frame rate. Defaults to None.
-    
-    Returns:
-        np.ndarray: 2D array representing the maze.
+        walls (np.ndarray): 2D array of wall bitmasks with all walls present, modified in place.
+        seed (int, optional): Seed of the random generator. Defaults to None.
+
+    Yields:
+        tuple: (cell, move) flat index of a cell and the direction of the wall removed from it.
     """
-    # Initialize maze
-    maze = np.full((N_ROWS, N_COLS), WALL, dtype=np.float32)
-    vis = set()
-
-    # Create chess board
-    for row in range(N_ROWS):
-        for col in range(N_COLS):
-            if row % 2 and col % 2:
-                maze[row][col] = FREE_CELL
-
-    # Place mouse and cheese
-    maze[1][1] = MOUSE
-    maze[N_ROWS-2][N_COLS-2] = CHEESE
-
-    # Display maze
-    if screen:
-        # Handle user input
-        for event in pygame.event.get():
-            # Close window
-            if event.type == pygame.QUIT:
-                return
-            
-        drawMaze(screen, maze)
-        pygame.display.flip()
-        clock.tick(DFS_FPS)
+    height, width = walls.shape
+    flat = walls.reshape(-1)
+    n_cells = height*width
 
-    # Choose start position
-    row = 2*random.randint(0, N_ROWS // 2 - 1) + 1
-    col = 2*random.randint(0, N_COLS // 2 - 1) + 1
+    vis = np.zeros(n_cells, dtype=np.bool_)
+    stack = np.empty(n_cells, dtype=np.int32)
+
+    rng = random.Random(seed)
 
-    stack = deque()
-    stack.append((row, col))
-    vis.add((row, col))
+    # Choose start position
+    cell = rng.randrange(n_cells)
+    vis[cell] = True
+    stack[0] = cell
+    top = 1
 
     # Analyze rest of cells
-    while len(stack):
-        # Mark cell as visited
-        row, col = stack.pop()
-
-        moves = [UP, DOWN, LEFT, RIGHT]
-        random.shuffle(moves)
-        
-        # Check each move for
-        for move in moves:
-           # Go Upwards
-            if move == UP:
-                # Cannot expand
-                if row - 2 < 0 or (row-2, col) in vis:
-                    continue
-                
-                # Push onto stack
-                maze[row - 1][col] = FREE_CELL
-                vis.add((row-2, col))
-                stack.append((row-2, col))
-
-            # Go Downwards
-            elif move == DOWN:
-                # Cannot expand
-                if row + 2 >= N_ROWS or (row+2, col) in vis:
-                    continue
-
-                # Go to next cell
-                maze[row + 1][col] = FREE_CELL
-                vis.add((row+2, col))
-                stack.append((row+2, col))
-
-            # Go Leftwards
-            elif move == LEFT:
-                # Cannot expand
-                if col - 2 < 0 or (row, col-2) in vis:
-                    continue
-
-                # Go to next cell
-                maze[row][col - 1] = FREE_CELL
-                vis.add((row, col-2))
-                stack.append((row, col-2))
-            
-            # Go Rightwards
-            else:
-                # Cannot expand
-                if col + 2 >= N_COLS or (row, col+2) in vis:
-                    continue
-
-                # Go to next cell
-                maze[row][col + 1] = FREE_CELL
-                vis.add((row, col+2))
-                stack.append((row, col+2))
-
-        # Display maze
-        if screen:
-            # Handle user input
-            for event in pygame.event.get():
-                # Close window
-                if event.type == pygame.QUIT:
-                    return
-                
-            drawMaze(screen, maze)
-            pygame.display.flip()
-            clock.tick(DFS_FPS)
-    
-    return maze
\ No newline at end of file
+    while top:
+        cell = int(stack[top-1])
+        row, col = divmod(cell, width)
+
+        # Collect unvisited neighbours
+        moves = []
+        if row > 0 and not vis[cell - width]:
+            moves.append((cell - width, UP))
+        if row < height - 1 and not vis[cell + width]:
+            moves.append((cell + width, DOWN))
+        if col > 0 and not vis[cell - 1]:
+            moves.append((cell - 1, LEFT))
+        if col < width - 1 and not vis[cell + 1]:
+            moves.append((cell + 1, RIGHT))
+
+        # Dead end, go back
+        if not moves:
+            top -= 1
+            continue
+
+        # Remove the wall between both cells
+        nxt, move = moves[rng.randrange(len(moves))]
+        flat[cell] &= ALL_WALLS ^ (1 << move)
+        flat[nxt] &= ALL_WALLS ^ (1 << opposite(move))
+        yield cell, move
+
+        # Push onto stack
+        vis[nxt] = True
+        stack[top] = nxt
+        top += 1
+
+def generate(n_rows=N_ROWS, n_cols=N_COLS, seed=None, compact=False):
+    """
+    Create a random maze of any size using depth-first search (DFS) with stack.
+
+    Args:
+        n_rows (int, optional): Number of maze rows, must be odd. Defaults to N_ROWS.
+        n_cols (int, optional): Number of maze columns, must be odd. Defaults to N_COLS.
+        seed (int, optional): Seed of the random generator. Defaults to None.
+        compact (bool, optional): Return wall bitmasks instead of the grid. Defaults to False.
+
+    Returns:
+        np.ndarray: 2D array representing the maze, or 2D uint8 array of wall bitmasks if `compact` is set.
+
+    Raises:
+        ValueError: If the maze size is invalid.
+    """
+    checkSize(n_rows, n_cols)
+    walls = np.full((n_rows // 2, n_cols // 2), ALL_WALLS, dtype=np.uint8)
+
+    for _ in carve(walls, seed):
+        pass
+
+    return walls if compact else decode(walls)
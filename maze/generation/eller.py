@@ -0,0 +1,120 @@
+"""
+Maze generator using Eller's algorithm.
+
+This module creates a random maze one row at a time using Eller's algorithm. Only the
+current row of sets is kept in memory, so very tall mazes can be streamed to disk row by row.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+from maze.app.consts import N_ROWS, N_COLS, FREE_CELL, CHEESE, MOUSE, WALL
+from maze.generation.grid import checkSize
+import numpy as np
+
+def rows(n_rows=N_ROWS, n_cols=N_COLS, seed=None):
+    """
+    Yield rows of a random maze created with Eller's algorithm.
+
+    Each cell row is followed by the row of walls below it. Cells that are joined
+    horizontally share a set, and every set is carried to the next row by at least
+    one vertical passage. The last cell row joins all remaining sets.
+
+    Args:
+        n_rows (int, optional): Number of maze rows, must be odd. Defaults to N_ROWS.
+        n_cols (int, optional): Number of maze columns, must be odd. Defaults to N_COLS.
+        seed (int, optional): Seed of the random generator. Defaults to None.
+
+    Yields:
+        np.ndarray: 1D array of length `n_cols` representing the next maze row.
+
+    Raises:
+        ValueError: If the maze size is invalid.
+    """
+    checkSize(n_rows, n_cols)
+    height, width = n_rows // 2, n_cols // 2
+    rng = np.random.default_rng(seed)
+
+    # Every cell starts in its own set
+    sets = np.arange(width)
+
+    # Top border
+    yield np.full(n_cols, WALL, dtype=np.float32)
+
+    for row in range(height):
+        is_last = row == height - 1
+
+        # Join neighbouring cells from different sets, merged sets point to their new label
+        east = rng.random(width - 1) < 0.5
+        labels = sets.tolist()
+        parent = list(range(width))
+        for col in range(width - 1):
+            left, right = __find(parent, labels[col]), __find(parent, labels[col+1])
+            if left == right or not (east[col] or is_last):
+                east[col] = False
+                continue
+            east[col] = True
+            parent[right] = left
+        sets = np.array([__find(parent, label) for label in labels])
+
+        # Create cell row
+        cells = np.full(n_cols, WALL, dtype=np.float32)
+        cells[1::2] = FREE_CELL
+        cells[2:-1:2][east] = FREE_CELL
+        if row == 0:
+            cells[1] = MOUSE
+        if is_last:
+            cells[n_cols-2] = CHEESE
+        yield cells
+
+        # Bottom border
+        if is_last:
+            yield np.full(n_cols, WALL, dtype=np.float32)
+            break
+
+        # Pick random passages down, at least one per set
+        down = rng.random(width) < 0.5
+        order = rng.permutation(width)
+        _, first = np.unique(sets[order], return_index=True)
+        down[order[first]] = True
+
+        # Create wall row
+        walls = np.full(n_cols, WALL, dtype=np.float32)
+        walls[1::2][down] = FREE_CELL
+        yield walls
+
+        # Carry sets down and relabel them to stay below the width
+        sets = np.where(down, sets, width + np.arange(width))
+        sets = np.unique(sets, return_inverse=True)[1]
+
+def __find(parent, label):
+    """
+    Find the label a set was merged into, halving the paths on the way.
+
+    Args:
+        parent (list): Label every label was merged into, itself if it was not merged.
+        label (int): Label of a set.
+
+    Returns:
+        int: Label of the merged set.
+    """
+    while parent[label] != label:
+        parent[label] = parent[parent[label]]
+        label = parent[label]
+    return label
+
+def generate(n_rows=N_ROWS, n_cols=N_COLS, seed=None):
+    """
+    Create a random maze using Eller's algorithm.
+
+    Args:
+        n_rows (int, optional): Number of maze rows, must be odd. Defaults to N_ROWS.
+        n_cols (int, optional): Number of maze columns, must be odd. Defaults to N_COLS.
+        seed (int, optional): Seed of the random generator. Defaults to None.
+
+    Returns:
+        np.ndarray: 2D array representing the maze.
+
+    Raises:
+        ValueError: If the maze size is invalid.
+    """
+    return np.vstack(list(rows(n_rows, n_cols, seed)))
@@ -0,0 +1,59 @@
+"""
+Maze grid helpers.
+
+This module contains helpers shared by the maze generators, such as building the initial
+chess board of free cells and placing the mouse and the cheese.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+from maze.app.consts import FREE_CELL, CHEESE, MOUSE, WALL
+import numpy as np
+
+def checkSize(n_rows, n_cols):
+    """
+    Validate the size of a maze.
+
+    Free cells lie on odd coordinates and are surrounded by walls, so both dimensions
+    have to be odd and at least 3.
+
+    Args:
+        n_rows (int): Number of maze rows.
+        n_cols (int): Number of maze columns.
+
+    Raises:
+        ValueError: If the maze size is invalid.
+    """
+    if n_rows < 3 or n_cols < 3 or n_rows % 2 == 0 or n_cols % 2 == 0:
+        raise ValueError(f'Maze size must be odd and at least 3x3, got {n_rows}x{n_cols}')
+
+def lattice(n_rows, n_cols):
+    """
+    Create a maze where every free cell is separated from its neighbours by walls.
+
+    Args:
+        n_rows (int): Number of maze rows.
+        n_cols (int): Number of maze columns.
+
+    Returns:
+        np.ndarray: 2D array with the chess board pattern.
+    """
+    checkSize(n_rows, n_cols)
+    maze = np.full((n_rows, n_cols), WALL, dtype=np.float32)
+    maze[1::2, 1::2] = FREE_CELL
+    return maze
+
+def placeMouseAndCheese(maze):
+    """
+    Place the mouse in the top-left and the cheese in the bottom-right cell of the maze.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+
+    Returns:
+        np.ndarray: The same maze.
+    """
+    n_rows, n_cols = maze.shape
+    maze[1][1] = MOUSE
+    maze[n_rows-2][n_cols-2] = CHEESE
+    return maze
@@ -2,112 +2,117 @@
 Maze generator using randomized Kruskal's algorithm.
 
 This module creates a random maze using an iterative approach of randomized Kruskal's algorithm. 
-It can optionally display the maze generation step-by-step using pygame.
+The generation is split into carve steps, so it can be displayed step-by-step (see `maze.app.animation`).
 
 Author: Michał Zientek
 Date: 2025-08-16
 """
-from maze.app.consts import N_ROWS, N_COLS, FREE_CELL, CHEESE, MOUSE, WALL, KRUSKAL_FPS 
-from maze.app.visualizer import drawMaze
-from collections import deque
+from maze.app.consts import N_ROWS, N_COLS, UP, DOWN, LEFT, RIGHT
+from maze.app.bitmask import ALL_WALLS, decode
+from maze.generation.grid import checkSize
 import numpy as np
-import random
-import pygame
 
-def create(screen=None, clock=None):
+# Number of shuffled walls processed at once
+WALL_CHUNK = 1 << 16
+
+def carve(walls, seed=None):
     """
-    Create a random maze using randomized kruskal's algorithm.
-    
-    Optionally display the maze on a pygame screen.
-    
+    Carve a random maze into wall bitmasks using randomized kruskal's algorithm.
+
+    The wall list is built with NumPy index arithmetic and the sets are tracked by a
+    Union-Find with union by rank, so the generation is near-linear in the number of cells.
+
     Args:
-        screen (pygame.Surface, optional): Screen to draw maze on. Defaults to None.
-        clock (pygame.time.Clock, optional): Clock controls the frame rate. Defaults to None.
-    
-    Returns:
-        np.ndarray: 2D array representing the maze.
+        walls (np.ndarray): 2D array of wall bitmasks with all walls present, modified in place.
+        seed (int, optional): Seed of the random generator. Defaults to None.
+
+    Yields:
+        tuple: (cell, move) flat index of a cell and the direction of the wall removed from it.
     """
-    # Initialize maze
-    maze = np.full((N_ROWS, N_COLS), WALL, dtype=np.float32)
-    union_find = UnionFind((N_ROWS//2)*(N_COLS//2))
-    wall_list = deque()
-
-    # Create chess board pattern
-    for row in range(N_ROWS):
-        for col in range(N_COLS):
-            if row % 2 and col % 2:
-                maze[row][col] = FREE_CELL
-    
-    # Identify walls between free cells
-    for row in range(1, N_ROWS-1):
-        for col in range(1, N_COLS-1):
-            # Vertical wall
-            if maze[row-1][col] == FREE_CELL and maze[row+1][col] == FREE_CELL:
-                wall_list.append((row, col, False))
-            
-            # Horizontal wall
-            elif maze[row][col-1] == FREE_CELL and maze[row][col+1] == FREE_CELL:
-                wall_list.append((row, col, True))
-
-    # Place mouse and cheese
-    maze[1][1] = MOUSE
-    maze[N_ROWS-2][N_COLS-2] = CHEESE
-
-    # Display maze if screen is given
-    if screen:
-        for event in pygame.event.get():
-            # Close window
-            if event.type == pygame.QUIT:
-                return
-        drawMaze(screen, maze)
-        pygame.display.flip()
-        clock.tick(KRUSKAL_FPS)
-    
+    height, width = walls.shape
+    flat = walls.reshape(-1)
+    n_cells = height*width
+    union_find = UnionFind(n_cells, 2*width + 1)
+
+    # Identify pairs of neighbouring cells, horizontal ones first
+    cells = np.arange(n_cells, dtype=np.int32).reshape(height, width)
+    first = np.concatenate((cells[:, :-1].ravel(), cells[:-1, :].ravel()))
+    second = np.concatenate((cells[:, 1:].ravel(), cells[1:, :].ravel()))
+    n_horizontal = height*(width - 1)
+
     # Shuffle walls and start maze generation
-    random.shuffle(wall_list)
-    while union_find.count() > 1:
-        row, col, is_horizontal = wall_list.pop()
-
-        # Vertical wall removal
-        if not is_horizontal and union_find.find(union_find.cell_id(row-1, col)) != union_find.find(union_find.cell_id(row+1, col)):
-            union_find.union(union_find.cell_id(row-1, col), union_find.cell_id(row+1, col))
-            maze[row][col] = FREE_CELL
-
-        # Horizontal wall removal
-        elif is_horizontal and union_find.find(union_find.cell_id(row, col-1)) != union_find.find(union_find.cell_id(row, col+1)):
-            union_find.union(union_find.cell_id(row, col-1), union_find.cell_id(row, col+1))
-            maze[row][col] = FREE_CELL
-        
-        # Update display
-        if screen:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return
-            drawMaze(screen, maze)
-            pygame.display.flip()
-            clock.tick(KRUSKAL_FPS)
-    
-    return maze
+    order = np.random.default_rng(seed).permutation(len(first))
+    for start in range(0, len(order), WALL_CHUNK):
+        chunk = order[start:start+WALL_CHUNK]
+
+        for wall, x, y in zip(chunk.tolist(), first[chunk].tolist(), second[chunk].tolist()):
+            # Cells are in the same set
+            if not union_find.union(x, y):
+                continue
+
+            # Remove the wall between both cells
+            if wall < n_horizontal:
+                flat[x] &= ALL_WALLS ^ (1 << RIGHT)
+                flat[y] &= ALL_WALLS ^ (1 << LEFT)
+                yield x, RIGHT
+            else:
+                flat[x] &= ALL_WALLS ^ (1 << DOWN)
+                flat[y] &= ALL_WALLS ^ (1 << UP)
+                yield x, DOWN
+
+            # All cells are connected
+            if union_find.count() == 1:
+                return
+
+def generate(n_rows=N_ROWS, n_cols=N_COLS, seed=None, compact=False):
+    """
+    Create a random maze of any size using randomized kruskal's algorithm.
+
+    Args:
+        n_rows (int, optional): Number of maze rows, must be odd. Defaults to N_ROWS.
+        n_cols (int, optional): Number of maze columns, must be odd. Defaults to N_COLS.
+        seed (int, optional): Seed of the random generator. Defaults to None.
+        compact (bool, optional): Return wall bitmasks instead of the grid. Defaults to False.
+
+    Returns:
+        np.ndarray: 2D array representing the maze, or 2D uint8 array of wall bitmasks if `compact` is set.
+
+    Raises:
+        ValueError: If the maze size is invalid.
+    """
+    checkSize(n_rows, n_cols)
+    walls = np.full((n_rows // 2, n_cols // 2), ALL_WALLS, dtype=np.uint8)
+
+    for _ in carve(walls, seed):
+        pass
+
+    return walls if compact else decode(walls)
 
 
 class UnionFind:
     """
-    Simple Union-Find (Disjoint Set) class for maze generation.
+    Union-Find (Disjoint Set) class for maze generation.
+
+    Uses union by rank and path halving, and keeps track of the number of sets.
     """
 
-    def __init__(self, size):
+    def __init__(self, size, n_cols=N_COLS):
         """
         Create Union-Find with given number of elements.
         
         Args:
             size (int): Number of elements.
+            n_cols (int, optional): Number of maze columns used by `cell_id`. Defaults to N_COLS.
         """
-        self.parents = np.arange(size)
+        self.parents = np.arange(size, dtype=np.int32)
+        self.ranks = np.zeros(size, dtype=np.uint8)
         self.size = size
+        self.n_sets = size
+        self.n_cols = n_cols
 
     def find(self, x):
         """
-        Find root parent of element x with path compression.
+        Find root parent of element x with path halving.
         
         Args:
             x (int): Element index.
@@ -115,9 +120,11 @@ class UnionFind:
         Returns:
             int: Root parent index.
         """
-        if self.parents[x] != x:
-            self.parents[x] = self.find(self.parents[x])
-        return self.parents[x]
+        parents = self.parents
+        while parents[x] != x:
+            parents[x] = parents[parents[x]]
+            x = parents[x]
+        return int(x)
     
     def union(self, x, y):
         """
@@ -126,8 +133,23 @@ class UnionFind:
         Args:
             x (int): First element index.
             y (int): Second element index.
+
+        Returns:
+            bool: True if the sets were disjointed and got joined.
         """
-        self.parents[self.find(x)] = self.find(y)
+        x, y = self.find(x), self.find(y)
+        if x == y:
+            return False
+
+        # Attach shorter tree under the taller one
+        if self.ranks[x] < self.ranks[y]:
+            x, y = y, x
+        self.parents[y] = x
+        if self.ranks[x] == self.ranks[y]:
+            self.ranks[x] += 1
+
+        self.n_sets -= 1
+        return True
     
     def count(self):
         """
@@ -136,11 +158,7 @@ class UnionFind:
         Returns:
             int: Number of sets.
         """
-        n_unions = 0
-        for i in range(self.size):
-            if self.parents[i] == i:
-                n_unions += 1
-        return n_unions
+        return self.n_sets
     
     def cell_id(self, row, col):
         """
@@ -153,4 +171,4 @@ class UnionFind:
         Returns:
             int: Index in Union-Find structure.
         """
-        return (row//2)*(N_COLS//2) + (col//2)
+        return (row//2)*(self.n_cols//2) + (col//2)
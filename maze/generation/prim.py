@@ -2,124 +2,166 @@
 Maze generator using Prim's algorithm.
 
 This module generates a random maze using Prim's algorithm.
-It can optionally display the maze generation step-by-step using pygame.
+The generation is split into carve steps, so it can be displayed step-by-step (see `maze.app.animation`).
 
 Author: Michał Zientek
 Date: 2025-08-16
 """
-from maze.app.consts import N_ROWS, N_COLS, FREE_CELL, CHEESE, MOUSE, WALL, PRIM_FPS 
-from maze.app.visualizer import drawMaze
+from maze.app.consts import N_ROWS, N_COLS, UP, DOWN, LEFT, RIGHT
+from maze.app.bitmask import ALL_WALLS, decode, opposite
+from maze.generation.grid import checkSize
 import numpy as np
 import random
-import pygame
 
-def create(screen=None, clock=None):
+def carve(walls, seed=None):
     """
-    Generate a maze using Prim's algorithm.
+    Carve a random maze into wall bitmasks using Prim's algorithm.
 
-    Starts with a random cell, marks it as free,
-    and then grows the maze by expanding walls
-    until all cells are connected.
+    Starts with a random cell and grows the maze by picking a random frontier cell
+    and connecting it to a random neighbour that is already part of the maze.
+    Every cell enters the frontier once, so the generation runs in linear time.
 
     Args:
-        screen (pygame.Surface, optional): If given, the maze is displayed step by step.
-        clock (pygame.time.Clock, optional): Clock controls the frame rate. Defaults to None.
-    
-    Returns:
-        np.ndarray: 2D numpy array with the final maze.
+        walls (np.ndarray): 2D array of wall bitmasks with all walls present, modified in place.
+        seed (int, optional): Seed of the random generator. Defaults to None.
+
+    Yields:
+        tuple: (cell, move) flat index of a cell and the direction of the wall removed from it.
     """
-    # Initialize maze
-    maze = np.full((N_ROWS, N_COLS), WALL, dtype=np.float32)
-    wall_list = []
+    height, width = walls.shape
+    flat = walls.reshape(-1)
+    n_cells = height*width
+
+    vis = np.zeros(n_cells, dtype=np.bool_)
+    rng = random.Random(seed)
+    frontier = Frontier(n_cells, rng)
 
     # Choose start position
-    row = 2*random.randint(0, N_ROWS // 2 - 1) + 1
-    col = 2*random.randint(0, N_COLS // 2 - 1) + 1
-    maze[row][col] = FREE_CELL
-    
-    
-    __expandMaze(wall_list, row, col)
-
-    # Display maze
-    if screen:
-        # Handle user input
-        for event in pygame.event.get():
-            # Close window
-            if event.type == pygame.QUIT:
-                return
-            
-        drawMaze(screen, maze)
-        pygame.display.flip()
-        clock.tick(PRIM_FPS)
-
-    # Visit all cells seperated by walls
-    random.shuffle(wall_list)
-    while len(wall_list):
-        # Pop wall
-        wall, cell = random.choice(wall_list)
-        wall_list.remove((wall, cell))
-
-        # Unpack data
-        w_row, w_col = wall
-        c_row, c_col = cell
-
-        # Cell is unvisited
-        if maze[c_row][c_col] == WALL or maze[row][col] == MOUSE or maze[row][col] == CHEESE:
-            maze[w_row][w_col] = FREE_CELL
-            maze[c_row][c_col] = FREE_CELL
-            __expandMaze(wall_list, c_row, c_col)
-
-        # Display maze
-        if screen:
-            # Handle user input
-            for event in pygame.event.get():
-                # Close window
-                if event.type == pygame.QUIT:
-                    return
-                
-            drawMaze(screen, maze)
-            pygame.display.flip()
-            clock.tick(PRIM_FPS)
-    
-    # Place mouse and cheese
-    maze[1][1] = MOUSE
-    maze[N_ROWS-2][N_COLS-2] = CHEESE
-
-    # Display maze
-    if screen:
-        # Handle user input
-        for event in pygame.event.get():
-            # Close window
-            if event.type == pygame.QUIT:
-                return
-                
-        drawMaze(screen, maze)
-        pygame.display.flip()
-        clock.tick(PRIM_FPS)
-
-    return maze
-
-def __expandMaze(wall_list, row, col):
+    cell = rng.randrange(n_cells)
+    vis[cell] = True
+    __expandFrontier(frontier, vis, cell, height, width)
+
+    # Visit all cells from the frontier
+    while len(frontier):
+        cell = frontier.pop()
+        row, col = divmod(cell, width)
+
+        # Collect neighbours already in the maze
+        links = []
+        if row > 0 and vis[cell - width]:
+            links.append((cell - width, UP))
+        if row < height - 1 and vis[cell + width]:
+            links.append((cell + width, DOWN))
+        if col > 0 and vis[cell - 1]:
+            links.append((cell - 1, LEFT))
+        if col < width - 1 and vis[cell + 1]:
+            links.append((cell + 1, RIGHT))
+
+        # Remove the wall to one of them
+        link, move = links[rng.randrange(len(links))]
+        flat[cell] &= ALL_WALLS ^ (1 << move)
+        flat[link] &= ALL_WALLS ^ (1 << opposite(move))
+        yield cell, move
+
+        vis[cell] = True
+        __expandFrontier(frontier, vis, cell, height, width)
+
+def generate(n_rows=N_ROWS, n_cols=N_COLS, seed=None, compact=False):
+    """
+    Generate a maze of any size using Prim's algorithm.
+
+    Args:
+        n_rows (int, optional): Number of maze rows, must be odd. Defaults to N_ROWS.
+        n_cols (int, optional): Number of maze columns, must be odd. Defaults to N_COLS.
+        seed (int, optional): Seed of the random generator. Defaults to None.
+        compact (bool, optional): Return wall bitmasks instead of the grid. Defaults to False.
+
+    Returns:
+        np.ndarray: 2D numpy array with the final maze, or 2D uint8 array of wall bitmasks if `compact` is set.
+
+    Raises:
+        ValueError: If the maze size is invalid.
+    """
+    checkSize(n_rows, n_cols)
+    walls = np.full((n_rows // 2, n_cols // 2), ALL_WALLS, dtype=np.uint8)
+
+    for _ in carve(walls, seed):
+        pass
+
+    return walls if compact else decode(walls)
+
+def __expandFrontier(frontier, vis, cell, height, width):
     """
-    Add walls and their opposite cells to the wall list.
+    Add unvisited neighbours of the cell to the frontier.
 
     Args:
-        wall_list (list): List of walls with their neighbor cells.
-        row (int): Current cell row.
-        col (int): Current cell column.
+        frontier (Frontier): Cells adjacent to the maze.
+        vis (np.ndarray): Boolean array marking cells that are part of the maze.
+        cell (int): Flat index of the current cell.
+        height (int): Number of cell rows.
+        width (int): Number of cell columns.
+    """
+    row, col = divmod(cell, width)
+
+    if row > 0 and not vis[cell - width]:
+        frontier.push(cell - width)
+    if row < height - 1 and not vis[cell + width]:
+        frontier.push(cell + width)
+    if col > 0 and not vis[cell - 1]:
+        frontier.push(cell - 1)
+    if col < width - 1 and not vis[cell + 1]:
+        frontier.push(cell + 1)
+
+
+class Frontier:
+    """
+    Set of cells with constant time insertion and random removal.
+
+    Cells are kept in a preallocated array of flat indices. A random cell is removed by
+    swapping it with the last one, and each cell can be present only once.
     """
-    # Add top wall + cell
-    if row-2 > 0:
-        wall_list.append(((row-1, col), (row-2, col)))
-    
-    # Add bottom wall + cell
-    if row+2 < N_ROWS:
-        wall_list.append(((row+1, col), (row+2, col)))
-    
-    # Add left wall + cell
-    if col-2 > 0:
-        wall_list.append(((row, col-1), (row, col-2)))
-    
-    # Add right wall + cell
-    if col+2 < N_COLS:
-        wall_list.append(((row, col+1), (row, col+2)))
\ No newline at end of file
+
+    def __init__(self, size, rng=random):
+        """
+        Create an empty frontier for given number of cells.
+
+        Args:
+            size (int): Number of cells.
+            rng (random.Random, optional): Source of randomness. Defaults to the random module.
+        """
+        self.cells = np.empty(size, dtype=np.int32)
+        self.contains = np.zeros(size, dtype=np.bool_)
+        self.size = 0
+        self.rng = rng
+
+    def __len__(self):
+        return self.size
+
+    def push(self, cell):
+        """
+        Add cell to the frontier unless it is already there.
+
+        Args:
+            cell (int): Flat cell index.
+        """
+        if self.contains[cell]:
+            return
+        self.contains[cell] = True
+        self.cells[self.size] = cell
+        self.size += 1
+
+    def pop(self):
+        """
+        Remove and return a random cell.
+
+        Returns:
+            int: Flat cell index.
+        """
+        i = self.rng.randrange(self.size)
+        cell = int(self.cells[i])
+
+        # Swap with the last cell
+        self.size -= 1
+        self.cells[i] = self.cells[self.size]
+        self.contains[cell] = False
+        return cell
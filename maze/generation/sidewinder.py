@@ -0,0 +1,56 @@
+"""
+Maze generator using the sidewinder algorithm.
+
+This module creates a random maze row by row: runs of cells are joined eastwards and every
+run opens a single passage north. Runs of all rows are segmented at once with NumPy.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+from maze.app.consts import N_ROWS, N_COLS, FREE_CELL
+from maze.app.bitmask import encode
+from maze.generation.grid import lattice, placeMouseAndCheese
+import numpy as np
+
+def generate(n_rows=N_ROWS, n_cols=N_COLS, seed=None, compact=False):
+    """
+    Create a random maze using the sidewinder algorithm.
+
+    The top row is a single corridor. In every other row, each cell either extends the
+    current run east or closes it, and a random cell of every closed run opens a passage north.
+
+    Args:
+        n_rows (int, optional): Number of maze rows, must be odd. Defaults to N_ROWS.
+        n_cols (int, optional): Number of maze columns, must be odd. Defaults to N_COLS.
+        seed (int, optional): Seed of the random generator. Defaults to None.
+        compact (bool, optional): Return wall bitmasks instead of the grid. Defaults to False.
+
+    Returns:
+        np.ndarray: 2D array representing the maze, or 2D uint8 array of wall bitmasks if `compact` is set.
+
+    Raises:
+        ValueError: If the maze size is invalid.
+    """
+    # Initialize maze
+    maze = lattice(n_rows, n_cols)
+    height, width = n_rows // 2, n_cols // 2
+    rng = np.random.default_rng(seed)
+
+    # Extend runs east, the last column always closes them
+    east = rng.integers(0, 2, size=(height, width), dtype=np.bool_)
+    east[0, :] = True
+    east[:, -1] = False
+    maze[1::2, 2::2][east] = FREE_CELL
+
+    # Segment runs of all rows below the top one
+    ends = ~east[1:].ravel()
+    starts = np.flatnonzero(np.concatenate(([True], ends[:-1])))
+    lengths = np.flatnonzero(ends) - starts + 1
+
+    # Open a random cell of every run north
+    north = np.zeros((height - 1)*width, dtype=np.bool_)
+    north[starts + (rng.random(len(starts))*lengths).astype(np.int64)] = True
+    maze[2:-1:2, 1::2][north.reshape(height - 1, width)] = FREE_CELL
+
+    placeMouseAndCheese(maze)
+    return encode(maze) if compact else maze
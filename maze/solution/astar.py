@@ -1,163 +1,112 @@
 """
 Maze solver using A* algorithm.
 
-This module solves a maze using a variant of A* algorithm.
+This module solves a maze using A* algorithm with a binary heap and the Manhattan distance heuristic.
 It can optionally display the maze solution step-by-step using pygame.
 
 Author: Michał Zientek
 Date: 2025-08-24
 """
-from maze.app.consts import UP, DOWN, LEFT, RIGHT, WALL, INF, N_ROWS, N_COLS, FPS
-from maze.app.visualizer import drawPath
-from collections import deque
+from maze.app.consts import WALL, INF, FPS, SHIFTS
+from maze.solution.path import Path, steps
 import numpy as np
-import pygame
+import heapq
 
-def solve(maze, screen=None, clock=None):
+def search(maze, start, goal):
     """
-    Solve a maze using A* algorithm with stack.
+    Find the shortest path between two cells using A* algorithm.
+
+    Nodes are kept in a binary heap ordered by f = g + h, where h is the Manhattan distance to
+    the goal. Ties are broken in favour of the smaller h, so the search goes deep towards the goal
+    instead of expanding all nodes with equal f.
 
-    Optionally display maze solution step on pygame screen.
-    
     Args:
         maze (np.ndarray): 2D array representing the maze.
-        screen (pygame.Surface, optional): Screen to draw maze. Defaults to None.
-        clock (pygame.time.Clock, optional): Clock controls the frame rate. Defaults to None.
+        start (tuple): (row, col) of the start cell.
+        goal (tuple): (row, col) of the goal cell.
 
     Returns:
-        np.ndarray: 2D array representing the path.        
+        Path: Path from the start to the goal, empty if the goal is unreachable.
     """
+    n_rows, n_cols = maze.shape
+    free = (maze != WALL).reshape(-1)
+    changes = [(move, change, *SHIFTS[move]) for move, change in steps(n_cols)]
+    goal_row, goal_col = goal
+
     # Create required structures
-    dist = np.full((*maze.shape,2), (None, INF))
-    vis = maze == WALL
-    stck = deque()
+    dist = np.full(n_rows*n_cols, INF, dtype=np.int32)
+    came = np.full(n_rows*n_cols, -1, dtype=np.int8)
+    vis = np.zeros(n_rows*n_cols, dtype=np.bool_)
 
-    # Pick target node
-    dist[N_ROWS-2][N_COLS-2] = (None, 0)
-    stck.append((N_ROWS-2, N_COLS-2))
+    # Pick start node
+    cell = start[0]*n_cols + start[1]
+    target = goal_row*n_cols + goal_col
+    h = abs(start[0] - goal_row) + abs(start[1] - goal_col)
+    dist[cell] = 0
+    heap = [(h, h, cell)]
 
-    while len(stck):
-        row, col = stck.pop()
+    while heap:
+        _, _, cell = heapq.heappop(heap)
+
+        # Reached the goal
+        if cell == target:
+            break
 
         # Node already processed
-        if vis[row][col]: continue
-        
-        # Update nearby cells
-        if dist[row-1][col][1] > dist[row][col][1] + 1: # Up cell
-            dist[row-1][col] = (DOWN, dist[row][col][1] + 1)
-        
-        if dist[row+1][col][1] > dist[row][col][1] + 1: # Down cell
-            dist[row+1][col] = (UP, dist[row][col][1] + 1)
-
-        if dist[row][col-1][1] > dist[row][col][1] + 1: # Left cell
-            dist[row][col-1] = (RIGHT, dist[row][col][1] + 1)
-
-        if dist[row][col+1][1] > dist[row][col][1] + 1: # Right cell
-            dist[row][col+1] = (LEFT, dist[row][col][1] + 1)
-
-        # Push onto the stack unvisited cells
-        if not vis[row-1][col]: # Up cell
-            insertInOrder(dist, stck, (row-1, col))
-        
-        if not vis[row+1][col]: # Down cell
-            insertInOrder(dist, stck, (row+1, col))
-
-        if not vis[row][col-1]: # Left cell
-            insertInOrder(dist, stck, (row, col-1))
-
-        if not vis[row][col+1]: # Right cell
-            insertInOrder(dist, stck, (row, col+1))
-
-        # Mark as visited
-        vis[row][col] = True
-
-        # Reached the start
-        if row == 1 and col == 1:
-            stck.clear()
-    
-    # Save path from start to end
-    path = np.full(maze.shape, None)
-    stck.append((1, 1))
-
-    while len(stck):
-        row, col = stck.pop()
-        
-        # Save movement
-        path[row][col] = dist[row][col][0]
-        
-        if path[row][col] == UP:
-            stck.append((row-1, col))
-        
-        elif path[row][col] == DOWN:
-            stck.append((row+1, col))
-        
-        elif path[row][col] == LEFT:
-            stck.append((row, col-1))
-        
-        elif path[row][col] == RIGHT:
-            stck.append((row, col+1))
-        
-        # Remove arrow from mouse cell
-        if row == 1 and col == 1:
-            path[1][1] = None
-
-        # Visualize solution
-        if screen:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return
-            drawPath(screen, maze, path)
-            pygame.display.flip()
-            clock.tick(FPS)
-    
-    return path
+        if vis[cell]:
+            continue
+        vis[cell] = True
 
-def insertInOrder(dist, stck, pos):
+        # Update nearby cells
+        row, col = divmod(cell, n_cols)
+        distance = int(dist[cell]) + 1
+        for move, change, d_row, d_col in changes:
+            nxt = cell + change
+            if free[nxt] and distance < dist[nxt]:
+                dist[nxt] = distance
+                came[nxt] = move
+                h = abs(row + d_row - goal_row) + abs(col + d_col - goal_col)
+                heapq.heappush(heap, (distance + h, h, nxt))
+
+    # Goal is unreachable
+    if dist[target] == INF:
+        return Path([], maze.shape)
+
+    # Go back from the goal to the start
+    back = dict(steps(n_cols))
+    cells = [target]
+    while came[cells[-1]] != -1:
+        cells.append(cells[-1] - back[int(came[cells[-1]])])
+
+    return Path(cells[::-1], maze.shape)
+
+def solve(maze, screen=None, clock=None, start=None, goal=None):
     """
-    Insert a maze cell position into the stack (deque) in ascending order of distance + manhattan distance.
+    Solve a maze using A* algorithm.
 
-    This function maintains the stack `stck` sorted by the distance values stored in `dist` + manhattan distance.
-    It uses binary search to find the correct position and then inserts `pos` at that index.
+    Optionally display maze solution step on pygame screen.
 
     Args:
-        dist (np.ndarray): 2D array of tuples (direction, distance) for each cell.
-                           `distance` is used to determine the order.
-        stck (collections.deque): Deque of (row, col) positions kept sorted by distance.
-        pos (tuple): (row, col) position to insert into `stck`.
-    """
-    # Create variables
-    l, mid, r = 0, None, len(stck)
-    t_row, t_col = pos
-    target = dist[t_row][t_col][1] + computeDistanceToStart(pos)
-
-    # Binary Search
-    while l < r:
-        # Extract distance
-        mid = (l + r) // 2
-        m_row, m_col = stck[mid]
-        val = dist[m_row][m_col][1] + computeDistanceToStart(stck[mid])
-
-        # Shorten range from left
-        if val < target:
-            l = mid + 1
-        
-        # Shorten range from right
-        else:
-            r = mid
-
-    stck.insert(l, pos)
-
-def computeDistanceToStart(pos):
+        maze (np.ndarray): 2D array representing the maze.
+        screen (pygame.Surface, optional): Screen to draw maze. Defaults to None.
+        clock (pygame.time.Clock, optional): Clock controls the frame rate. Defaults to None.
+        start (tuple, optional): (row, col) of the start cell. Defaults to the top-left cell.
+        goal (tuple, optional): (row, col) of the goal cell. Defaults to the bottom-right cell.
+
+    Returns:
+        Path: Path from the start to the goal, its `toGrid` gives the 2D array of directions.
     """
-    Compute the Manhattan distance from the given position to the starting position.
+    n_rows, n_cols = maze.shape
+    start = start or (1, 1)
+    goal = goal or (n_rows-2, n_cols-2)
 
-    The start   is assumed to be located at (1, 1), 
-    typically representing the bottom-right corner of a grid offset by 2.
+    # Save path from start to end
+    path = search(maze, start, goal)
 
-    Parameters:
-        pos (tuple): A tuple (row, col) representing the current position.
-    """
-    x = 1 - pos[0]
-    y = 1 - pos[1]
+    # Visualize solution
+    if screen:
+        from maze.app.animation import animatePath
+        if not animatePath(screen, clock, maze, path, FPS):
+            return
 
-    return np.abs(x) + np.abs(y)
+    return path
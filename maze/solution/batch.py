@@ -0,0 +1,125 @@
+"""
+Batch maze solving.
+
+This module answers many path queries at once by spreading the work over a pool of processes.
+The mazes are copied once into shared memory and every worker maps them on start, so the jobs
+sent to the workers hold only the maze index and both cells instead of the whole grid.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+import maze.solution.dijkstra as dijkstra
+import maze.solution.wavefront as wavefront
+import maze.solution.astar as astar
+import maze.solution.bidirectional as bidirectional
+import maze.solution.jps as jps
+from multiprocessing import Pool, shared_memory
+import numpy as np
+import os
+
+# Available solvers
+ALGORITHMS = {
+    'dijkstra': dijkstra.search,
+    'wavefront': wavefront.search,
+    'astar': astar.search,
+    'bidirectional': bidirectional.search,
+    'jps': jps.search,
+}
+
+# Mazes mapped by a worker process
+__memory = None
+__mazes = None
+
+def stream(mazes, jobs, workers=None):
+    """
+    Solve path queries in parallel and yield the paths in order.
+
+    Args:
+        mazes (np.ndarray): 3D array of shape (n, n_rows, n_cols) with all mazes.
+        jobs (iterable): Tuples (maze index, start, goal, algorithm) where start and goal are (row, col)
+                         and algorithm is one of `ALGORITHMS`.
+        workers (int, optional): Number of processes. Defaults to the number of CPUs.
+
+    Yields:
+        Path: Path from the start to the goal, empty if the goal is unreachable.
+
+    Raises:
+        ValueError: If an algorithm is unknown.
+    """
+    jobs = list(jobs)
+    for *_, algorithm in jobs:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f'Unknown algorithm {algorithm!r}, expected one of {", ".join(ALGORITHMS)}')
+
+    mazes = np.ascontiguousarray(mazes)
+    workers = workers or os.cpu_count() or 1
+
+    # Solve in this process
+    if workers == 1:
+        __attach(None, mazes.shape, mazes.dtype, mazes)
+        for job in jobs:
+            yield __solvePath(job)
+        return
+
+    # Copy mazes to shared memory once
+    memory = shared_memory.SharedMemory(create=True, size=max(1, mazes.nbytes))
+    try:
+        np.ndarray(mazes.shape, dtype=mazes.dtype, buffer=memory.buf)[:] = mazes
+
+        # Send jobs in chunks to limit the overhead
+        with Pool(workers, initializer=__attach, initargs=(memory.name, mazes.shape, mazes.dtype)) as pool:
+            yield from pool.imap(__solvePath, jobs, chunksize=max(1, len(jobs) // (4*workers)))
+    finally:
+        memory.close()
+        memory.unlink()
+
+def solve(mazes, jobs, workers=None):
+    """
+    Solve a batch of path queries in parallel.
+
+    Args:
+        mazes (np.ndarray): 3D array of shape (n, n_rows, n_cols) with all mazes.
+        jobs (iterable): Tuples (maze index, start, goal, algorithm) where start and goal are (row, col)
+                         and algorithm is one of `ALGORITHMS`.
+        workers (int, optional): Number of processes. Defaults to the number of CPUs.
+
+    Returns:
+        list: Paths, one for every job.
+
+    Raises:
+        ValueError: If an algorithm is unknown.
+    """
+    return list(stream(mazes, jobs, workers))
+
+def __attach(name, shape, dtype, mazes=None):
+    """
+    Map the shared mazes in a worker process.
+
+    Args:
+        name (str): Name of the shared memory block.
+        shape (tuple): Shape of the mazes array.
+        dtype (np.dtype): Type of the mazes array.
+        mazes (np.ndarray, optional): Mazes to use directly instead of shared memory. Defaults to None.
+    """
+    global __memory, __mazes
+
+    if mazes is not None:
+        __memory, __mazes = None, mazes
+        return
+
+    # Keep the block open as long as the worker lives
+    __memory = shared_memory.SharedMemory(name=name)
+    __mazes = np.ndarray(shape, dtype=dtype, buffer=__memory.buf)
+
+def __solvePath(job):
+    """
+    Solve a single path query of the batch.
+
+    Args:
+        job (tuple): (maze index, start, goal, algorithm)
+
+    Returns:
+        Path: Path from the start to the goal.
+    """
+    index, start, goal, algorithm = job
+    return ALGORITHMS[algorithm](__mazes[index], tuple(start), tuple(goal))
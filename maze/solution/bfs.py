@@ -0,0 +1,90 @@
+"""
+Maze solver using breadth-first search (BFS) on wall bitmasks.
+
+This module solves a maze stored as wall bitmasks (see `maze.app.bitmask`). Every move
+is checked with a single bit test and only logical cells are visited, never the walls between them.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+from maze.app.consts import UP, DOWN, LEFT, RIGHT, INF, SHIFTS
+from maze.app.bitmask import opposite
+from maze.solution.path import Path
+import numpy as np
+
+def distances(walls, goal):
+    """
+    Compute the distance of every cell to the goal and the move leading towards it.
+
+    Args:
+        walls (np.ndarray): 2D array of wall bitmasks.
+        goal (tuple): (row, col) of the goal cell.
+
+    Returns:
+        tuple: (dist, moves)
+            - dist (np.ndarray): 2D int32 array of distances, INF for unreachable cells.
+            - moves (np.ndarray): 2D int8 array of moves towards the goal, -1 if there is none.
+    """
+    height, width = walls.shape
+    flat = walls.reshape(-1)
+    steps = ((UP, -width), (DOWN, width), (LEFT, -1), (RIGHT, 1))
+
+    # Create required structures
+    dist = np.full(height*width, INF, dtype=np.int32)
+    moves = np.full(height*width, -1, dtype=np.int8)
+    queue = np.empty(height*width, dtype=np.int32)
+
+    # Pick target node
+    cell = goal[0]*width + goal[1]
+    dist[cell] = 0
+    queue[0] = cell
+    head, tail = 0, 1
+
+    while head < tail:
+        cell = int(queue[head])
+        head += 1
+
+        # Visit open neighbours
+        for move, step in steps:
+            if flat[cell] & (1 << move) or dist[cell + step] != INF:
+                continue
+            dist[cell + step] = dist[cell] + 1
+            moves[cell + step] = opposite(move)
+            queue[tail] = cell + step
+            tail += 1
+
+    return dist.reshape(height, width), moves.reshape(height, width)
+
+def solve(walls, start=(0, 0), goal=None):
+    """
+    Solve a maze stored as wall bitmasks using breadth-first search.
+
+    Args:
+        walls (np.ndarray): 2D array of wall bitmasks.
+        start (tuple, optional): (row, col) of the start cell. Defaults to the top-left cell.
+        goal (tuple, optional): (row, col) of the goal cell. Defaults to the bottom-right cell.
+
+    Returns:
+        Path: Path on the maze grid (see `maze.app.bitmask.decode`), empty if the goal is unreachable.
+    """
+    height, width = walls.shape
+    if goal is None:
+        goal = (height - 1, width - 1)
+    _, moves = distances(walls, goal)
+
+    # Save path from start to end, every move passes a cell and the gap after it
+    n_cols = 2*width + 1
+    row, col = start
+    cells = [(2*row + 1)*n_cols + 2*col + 1]
+    while moves[row][col] != -1:
+        move = int(moves[row][col])
+        d_row, d_col = SHIFTS[move]
+        change = d_row*n_cols + d_col
+        cells += [cells[-1] + change, cells[-1] + 2*change]
+        row, col = row + d_row, col + d_col
+
+    # Goal is unreachable
+    if (row, col) != tuple(goal):
+        cells = []
+
+    return Path(cells, (2*height + 1, n_cols))
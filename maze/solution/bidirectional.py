@@ -0,0 +1,118 @@
+"""
+Maze solver using bidirectional breadth-first search (BFS).
+
+This module solves a maze by searching from the start and from the goal at the same time.
+The searches stop as soon as their frontiers meet, so each of them explores only about half
+of the distance between both cells.
+It can optionally display the maze solution step-by-step using pygame.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+from maze.app.consts import WALL, INF, FPS
+from maze.app.bitmask import opposite
+from maze.solution.path import Path, steps
+import numpy as np
+
+def search(maze, start, goal):
+    """
+    Find the shortest path between two cells using bidirectional BFS.
+
+    The side with the smaller frontier is expanded by a whole layer at a time. Once a layer
+    reaches cells visited by the other side, the best meeting cell of this layer is taken.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+        start (tuple): (row, col) of the start cell.
+        goal (tuple): (row, col) of the goal cell.
+
+    Returns:
+        Path: Path from the start to the goal, empty if the goal is unreachable.
+    """
+    n_rows, n_cols = maze.shape
+    free = (maze != WALL).reshape(-1)
+    changes = steps(n_cols)
+    back = dict(changes)
+
+    # Create required structures, index 0 is the start side and 1 the goal side
+    source = start[0]*n_cols + start[1]
+    target = goal[0]*n_cols + goal[1]
+    dist = [np.full(n_rows*n_cols, INF, dtype=np.int32) for _ in range(2)]
+    moves = [np.full(n_rows*n_cols, -1, dtype=np.int8) for _ in range(2)]
+    frontiers = [[source], [target]]
+    dist[0][source] = 0
+    dist[1][target] = 0
+
+    best, meet = INF, None if source != target else source
+
+    while meet is None and frontiers[0] and frontiers[1]:
+        # Expand the smaller frontier
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        own, other = dist[side], dist[1 - side]
+        layer = []
+
+        for cell in frontiers[side]:
+            distance = int(own[cell]) + 1
+
+            for move, change in changes:
+                nxt = cell + change
+                if not free[nxt] or own[nxt] != INF:
+                    continue
+
+                # Start side stores the move into the cell, goal side the move out of it
+                own[nxt] = distance
+                moves[side][nxt] = move if side == 0 else opposite(move)
+                layer.append(nxt)
+
+                # Frontiers met
+                if distance + other[nxt] < best:
+                    best, meet = distance + int(other[nxt]), nxt
+
+        frontiers[side] = layer
+
+    # Goal is unreachable
+    if meet is None:
+        return Path([], maze.shape)
+
+    # Go back to the start
+    cells = [meet]
+    while cells[-1] != source:
+        cells.append(cells[-1] - back[int(moves[0][cells[-1]])])
+    cells.reverse()
+
+    # Go forward to the goal
+    while cells[-1] != target:
+        cells.append(cells[-1] + back[int(moves[1][cells[-1]])])
+
+    return Path(cells, maze.shape)
+
+def solve(maze, screen=None, clock=None, start=None, goal=None):
+    """
+    Solve a maze using bidirectional BFS.
+
+    Optionally display maze solution step on pygame screen.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+        screen (pygame.Surface, optional): Screen to draw maze. Defaults to None.
+        clock (pygame.time.Clock, optional): Clock controls the frame rate. Defaults to None.
+        start (tuple, optional): (row, col) of the start cell. Defaults to the top-left cell.
+        goal (tuple, optional): (row, col) of the goal cell. Defaults to the bottom-right cell.
+
+    Returns:
+        Path: Path from the start to the goal, its `toGrid` gives the 2D array of directions.
+    """
+    n_rows, n_cols = maze.shape
+    start = start or (1, 1)
+    goal = goal or (n_rows-2, n_cols-2)
+
+    # Save path from start to end
+    path = search(maze, start, goal)
+
+    # Visualize solution
+    if screen:
+        from maze.app.animation import animatePath
+        if not animatePath(screen, clock, maze, path, FPS):
+            return
+
+    return path
@@ -0,0 +1,121 @@
+"""
+Distance field cache.
+
+This module keeps the distance fields computed by the solvers, so solving the same maze again or
+towards the same goal from another start needs only a lookup. Mazes are identified by a hash of their
+content, and the least recently used fields are dropped once the cache holds too many bytes.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+from collections import OrderedDict
+import numpy as np
+import hashlib
+
+# Default memory limit of a cache
+MAX_BYTES = 256 << 20
+
+def digest(maze):
+    """
+    Hash the content of a maze.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+
+    Returns:
+        str: Hex digest of the shape, type and cells of the maze.
+    """
+    maze = np.ascontiguousarray(maze)
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(repr((maze.shape, maze.dtype.str)).encode())
+    hasher.update(maze.data)
+    return hasher.hexdigest()
+
+class FieldCache:
+    """
+    Least recently used cache of distance fields bounded by bytes.
+
+    Attributes:
+        max_bytes (int): Memory limit of the cached arrays.
+        nbytes (int): Memory used by the cached arrays.
+        entries (OrderedDict): Fields keyed by (maze digest, goal), the least recently used first.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups which computed the fields.
+    """
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        """
+        Create an empty cache.
+
+        Args:
+            max_bytes (int, optional): Memory limit of the cached arrays. Defaults to MAX_BYTES.
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, maze, goal, compute):
+        """
+        Return the fields of a maze and a goal, computing them on a miss.
+
+        Args:
+            maze (np.ndarray): 2D array representing the maze.
+            goal (tuple): (row, col) of the goal cell.
+            compute (callable): Function returning a tuple of arrays for the maze and the goal,
+                                e.g. `maze.solution.dijkstra.distances`.
+
+        Returns:
+            tuple: Read-only arrays returned by `compute`.
+        """
+        key = (digest(maze), (int(goal[0]), int(goal[1])))
+
+        # Cached fields become the most recently used
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+        self.misses += 1
+        fields = tuple(compute(maze, goal))
+        for field in fields:
+            field.setflags(write=False)
+
+        self.put(key, fields)
+        return fields
+
+    def put(self, key, fields):
+        """
+        Store fields and drop the least recently used ones above the memory limit.
+
+        Fields larger than the whole limit are not stored.
+
+        Args:
+            key (tuple): (maze digest, goal)
+            fields (tuple): Arrays to store.
+        """
+        size = sum(field.nbytes for field in fields)
+        if size > self.max_bytes:
+            return
+
+        # Replace old fields of the same key
+        if key in self.entries:
+            self.nbytes -= sum(field.nbytes for field in self.entries.pop(key))
+
+        self.entries[key] = fields
+        self.nbytes += size
+
+        while self.nbytes > self.max_bytes:
+            _, dropped = self.entries.popitem(last=False)
+            self.nbytes -= sum(field.nbytes for field in dropped)
+
+    def clear(self):
+        """
+        Remove all fields.
+        """
+        self.entries.clear()
+        self.nbytes = 0
@@ -1,144 +1,116 @@
 """
 Maze solver using dijkstra's algorithm.
 
-This module solves a maze using a variant of dijkstra's algorithm.
+This module solves a maze using dijkstra's algorithm with a binary heap. Distance fields are kept
+in a cache, so solving the same maze towards the same goal again is a lookup.
 It can optionally display the maze solution step-by-step using pygame.
 
 Author: Michał Zientek
 Date: 2025-08-18
 """
-from maze.app.consts import UP, DOWN, LEFT, RIGHT, WALL, INF, N_ROWS, N_COLS, FPS
-from maze.app.visualizer import drawPath
-from collections import deque
+from maze.app.consts import WALL, INF, FPS
+from maze.app.bitmask import opposite
+from maze.solution.path import Path, steps, trace
+from maze.solution.cache import FieldCache
 import numpy as np
-import pygame
+import heapq
 
-def solve(maze, screen=None, clock=None):
+# Distance fields shared by all solves
+CACHE = FieldCache()
+
+def distances(maze, goal):
     """
-    Solve a maze using dijkstra's algorithm with stack.
+    Compute the distance of every cell to the goal using dijkstra's algorithm with a binary heap.
 
-    Optionally display maze solution step on pygame screen.
-    
     Args:
         maze (np.ndarray): 2D array representing the maze.
-        screen (pygame.Surface, optional): Screen to draw maze. Defaults to None.
-        clock (pygame.time.Clock, optional): Clock controls the frame rate. Defaults to None.
+        goal (tuple): (row, col) of the goal cell.
 
     Returns:
-        np.ndarray: 2D array representing the path.        
+        tuple: (dist, moves)
+            - dist (np.ndarray): 2D int32 array of distances, INF for unreachable cells.
+            - moves (np.ndarray): 2D int8 array of moves towards the goal, -1 if there is none.
     """
+    n_rows, n_cols = maze.shape
+    free = (maze != WALL).reshape(-1)
+
     # Create required structures
-    dist = np.full((*maze.shape,2), (None, INF))
-    vis = maze == WALL
-    stck = deque()
+    dist = np.full(n_rows*n_cols, INF, dtype=np.int32)
+    moves = np.full(n_rows*n_cols, -1, dtype=np.int8)
+    changes = steps(n_cols)
 
     # Pick target node
-    dist[N_ROWS-2][N_COLS-2] = (None, 0)
-    stck.append((N_ROWS-2, N_COLS-2))
+    cell = goal[0]*n_cols + goal[1]
+    dist[cell] = 0
+    heap = [(0, cell)]
 
-    while len(stck):
-        row, col = stck.pop()
+    while heap:
+        distance, cell = heapq.heappop(heap)
+
+        # Node already processed with a shorter distance
+        if distance > dist[cell]:
+            continue
 
-        # Node already processed
-        if vis[row][col]: continue
-        
         # Update nearby cells
-        if dist[row-1][col][1] > dist[row][col][1] + 1: # Up cell
-            dist[row-1][col] = (DOWN, dist[row][col][1] + 1)
-        
-        if dist[row+1][col][1] > dist[row][col][1] + 1: # Down cell
-            dist[row+1][col] = (UP, dist[row][col][1] + 1)
+        for move, change in changes:
+            nxt = cell + change
+            if free[nxt] and distance + 1 < dist[nxt]:
+                dist[nxt] = distance + 1
+                moves[nxt] = opposite(move)
+                heapq.heappush(heap, (distance + 1, nxt))
 
-        if dist[row][col-1][1] > dist[row][col][1] + 1: # Left cell
-            dist[row][col-1] = (RIGHT, dist[row][col][1] + 1)
+    return dist.reshape(maze.shape), moves.reshape(maze.shape)
 
-        if dist[row][col+1][1] > dist[row][col][1] + 1: # Right cell
-            dist[row][col+1] = (LEFT, dist[row][col][1] + 1)
+def search(maze, start, goal, cache=CACHE):
+    """
+    Find the shortest path between two cells using dijkstra's algorithm.
 
-        # Push onto the stack unvisited cells
-        if not vis[row-1][col]: # Up cell
-            insertInOrder(dist, stck, (row-1, col))
-        
-        if not vis[row+1][col]: # Down cell
-            insertInOrder(dist, stck, (row+1, col))
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+        start (tuple): (row, col) of the start cell.
+        goal (tuple): (row, col) of the goal cell.
+        cache (FieldCache, optional): Cache of distance fields, None to always compute them. Defaults to CACHE.
 
-        if not vis[row][col-1]: # Left cell
-            insertInOrder(dist, stck, (row, col-1))
+    Returns:
+        Path: Path from the start to the goal, empty if the goal is unreachable.
+    """
+    n_cols = maze.shape[1]
+    dist, moves = cache.get(maze, goal, distances) if cache is not None else distances(maze, goal)
 
-        if not vis[row][col+1]: # Right cell
-            insertInOrder(dist, stck, (row, col+1))
+    # Goal is unreachable
+    if dist[start[0], start[1]] == INF:
+        return Path([], maze.shape)
 
-        # Mark as visited
-        vis[row][col] = True
-    
-    # Save path from start to end
-    path = np.full(maze.shape, None)
-    stck.append((1, 1))
-
-    while len(stck):
-        row, col = stck.pop()
-        
-        # Save movement
-        path[row][col] = dist[row][col][0]
-        
-        if path[row][col] == UP:
-            stck.append((row-1, col))
-        
-        elif path[row][col] == DOWN:
-            stck.append((row+1, col))
-        
-        elif path[row][col] == LEFT:
-            stck.append((row, col-1))
-        
-        elif path[row][col] == RIGHT:
-            stck.append((row, col+1))
-        
-        # Remove arrow from mouse cell
-        if row == 1 and col == 1:
-            path[1][1] = None
-
-        # Visualize solution
-        if screen:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return
-            drawPath(screen, maze, path)
-            pygame.display.flip()
-            clock.tick(FPS)
-    
-    return path
+    return Path(trace(moves.reshape(-1), start[0]*n_cols + start[1], n_cols), maze.shape)
 
-def insertInOrder(dist, stck, pos):
+def solve(maze, screen=None, clock=None, start=None, goal=None, cache=CACHE):
     """
-    Insert a maze cell position into the stack (deque) in ascending order of distance.
-
-    This function maintains the stack `stck` sorted by the distance values stored in `dist`.
-    It uses binary search to find the correct position and then inserts `pos` at that index.
+    Solve a maze using dijkstra's algorithm with a binary heap.
 
+    Optionally display maze solution step on pygame screen.
+    
     Args:
-        dist (np.ndarray): 2D array of tuples (direction, distance) for each cell.
-                           `distance` is used to determine the order.
-        stck (collections.deque): Deque of (row, col) positions kept sorted by distance.
-        pos (tuple): (row, col) position to insert into `stck`.
+        maze (np.ndarray): 2D array representing the maze.
+        screen (pygame.Surface, optional): Screen to draw maze. Defaults to None.
+        clock (pygame.time.Clock, optional): Clock controls the frame rate. Defaults to None.
+        start (tuple, optional): (row, col) of the start cell. Defaults to the top-left cell.
+        goal (tuple, optional): (row, col) of the goal cell. Defaults to the bottom-right cell.
+        cache (FieldCache, optional): Cache of distance fields, None to always compute them. Defaults to CACHE.
+
+    Returns:
+        Path: Path from the start to the goal, its `toGrid` gives the 2D array of directions.        
     """
-    # Create variables
-    l, mid, r = 0, None, len(stck)
-    t_row, t_col = pos
-    target = dist[t_row][t_col][1]
-
-    # Binary Search
-    while l < r:
-        # Extract distance
-        mid = (l + r) // 2
-        m_row, m_col = stck[mid]
-        val = dist[m_row][m_col][1]
-
-        # Shorten range from left
-        if val < target:
-            l = mid + 1
-        
-        # Shorten range from right
-        else:
-            r = mid
-
-    stck.insert(l, pos)
\ No newline at end of file
+    n_rows, n_cols = maze.shape
+    start = start or (1, 1)
+    goal = goal or (n_rows-2, n_cols-2)
+
+    # Save path from start to end
+    path = search(maze, start, goal, cache)
+
+    # Visualize solution
+    if screen:
+        from maze.app.animation import animatePath
+        if not animatePath(screen, clock, maze, path, FPS):
+            return
+
+    return path
@@ -1,13 +1,13 @@
 """
 Maze Q-learning version.
 
-This module contains q-learning optimized maze structure.
+This module contains q-learning optimized maze structures: `QMaze` moves a single mouse,
+`VectorQMaze` moves many mice at once using a precomputed table of transitions.
 
 Author: Michał Zientek
 Date: 2025-08-22
 """
-from maze.app.visualizer import drawMaze
-from maze.app.consts import N_ROWS, N_COLS, UP, DOWN, LEFT, RIGHT, FREE_CELL, MOUSE, WALL, CRASH_PENALTY, CHEESE, WIN_PRIZE, MOVE_COST, GO_BACK_PENALTY
+from maze.app.consts import N_ROWS, N_COLS, UP, DOWN, LEFT, RIGHT, FREE_CELL, MOUSE, WALL, CRASH_PENALTY, CHEESE, WIN_PRIZE, MOVE_COST, GO_BACK_PENALTY, SHIFTS
 import numpy as np
 
 class QMaze:
@@ -70,6 +70,7 @@ class QMaze:
         Args:
             screen (pygame.Surface): Pygame surface where the maze is drawn.
         """
+        from maze.app.visualizer import drawMaze
         drawMaze(screen, self.maze)
         
     def toState(self):
@@ -176,3 +177,146 @@ class QMaze:
         new_state = self.toState()
 
         return old_state, action, reward, new_state, self.is_terminated
+
+def transitions(maze, goal):
+    """
+    Compute the outcome of every action in every cell.
+
+    Rewards follow `QMaze.act` without the penalty for revisiting cells, which depends on the
+    history of the mouse rather than on the cell.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze structure.
+        goal (tuple): (row, col) of the cheese.
+
+    Returns:
+        tuple: (next_state, reward, crash, done) arrays of shape (n_rows * n_cols, 4)
+            - next_state (np.ndarray): int32 state after the action, the same state after crashing.
+            - reward (np.ndarray): float64 reward of the action.
+            - crash (np.ndarray): Boolean marking actions hitting a wall.
+            - done (np.ndarray): Boolean marking actions reaching the cheese.
+    """
+    n_rows, n_cols = maze.shape
+    n_states = n_rows*n_cols
+    free = (maze != WALL).reshape(-1)
+    cells = np.arange(n_states, dtype=np.int32)
+    rows, cols = np.divmod(cells, n_cols)
+
+    next_state = np.empty((n_states, 4), dtype=np.int32)
+    reward = np.empty((n_states, 4), dtype=np.float64)
+    crash = np.empty((n_states, 4), dtype=np.bool_)
+    done = np.empty((n_states, 4), dtype=np.bool_)
+
+    for action, (d_row, d_col) in SHIFTS.items():
+        inside = (0 <= rows + d_row) & (rows + d_row < n_rows) & (0 <= cols + d_col) & (cols + d_col < n_cols)
+        target = np.where(inside, cells + d_row*n_cols + d_col, cells)
+        moved = inside & free[target]
+
+        next_state[:, action] = np.where(moved, target, cells)
+        crash[:, action] = ~moved
+        done[:, action] = moved & (target == goal[0]*n_cols + goal[1])
+        reward[:, action] = np.where(moved, MOVE_COST, CRASH_PENALTY)
+        reward[done[:, action], action] = WIN_PRIZE
+
+    return next_state, reward, crash, done
+
+class VectorQMaze:
+    """
+    Environment moving many Q-learning mice through the same maze at once.
+
+    The maze does not change while the mice move, so the outcome of every action in every cell
+    is computed once. A step of all mice is then a few array lookups. Rewards follow `QMaze.act`:
+    crashing into a wall leaves the mouse in place, and a mouse is sent back to the start once it
+    finds the cheese or its total reward drops below the limit used by `qlearning.solve`.
+
+    Attributes:
+        shape (tuple): (n_rows, n_cols) of the maze.
+        n_envs (int): Number of mice.
+        start (int): State index of the start cell.
+        goal (int): State index of the cheese.
+        next_state (np.ndarray): 2D int32 array of shape (n_states, 4) with the state after every action.
+        reward (np.ndarray): 2D float64 array of shape (n_states, 4) with the reward of every action.
+        crash (np.ndarray): 2D boolean array of shape (n_states, 4) marking actions hitting a wall.
+        done (np.ndarray): 2D boolean array of shape (n_states, 4) marking actions reaching the cheese.
+        states (np.ndarray): int32 array with the state of every mouse.
+        vis (np.ndarray): 2D boolean array of shape (n_envs, n_states) marking cells visited by every mouse.
+        total_reward (np.ndarray): Reward collected by every mouse in the current episode.
+        n_episodes (int): Number of finished episodes of all mice.
+    """
+
+    def __init__(self, maze, n_envs, start=(1, 1), goal=None):
+        """
+        Initializes the environment and computes the transitions.
+
+        Args:
+            maze (np.ndarray): 2D array representing the maze structure.
+            n_envs (int): Number of mice.
+            start (tuple, optional): (row, col) of the start cell. Defaults to (1, 1).
+            goal (tuple, optional): (row, col) of the cheese. Defaults to the bottom-right cell.
+        """
+        n_rows, n_cols = maze.shape
+        goal = goal or (n_rows-2, n_cols-2)
+        n_states = n_rows*n_cols
+
+        self.shape = maze.shape
+        self.n_envs = n_envs
+        self.start = start[0]*n_cols + start[1]
+        self.goal = goal[0]*n_cols + goal[1]
+
+        # Outcome of every action in every cell
+        self.next_state, self.reward, self.crash, self.done = transitions(maze, goal)
+
+        # Place all mice at the start
+        self.states = np.full(n_envs, self.start, dtype=np.int32)
+        self.vis = np.zeros((n_envs, n_states), dtype=np.bool_)
+        self.total_reward = np.zeros(n_envs)
+        self.n_episodes = 0
+
+    def reset(self, mask=None):
+        """
+        Moves mice back to the start and clears their visited cells and rewards.
+
+        Args:
+            mask (np.ndarray, optional): Boolean array selecting the mice to reset. Defaults to all mice.
+        """
+        if mask is None:
+            mask = np.ones(self.n_envs, dtype=np.bool_)
+
+        self.states[mask] = self.start
+        self.vis[mask] = False
+        self.total_reward[mask] = 0.0
+
+    def step(self, actions):
+        """
+        Executes one action of every mouse.
+
+        Args:
+            actions (np.ndarray): Action of every mouse (UP, DOWN, LEFT, RIGHT).
+
+        Returns:
+            tuple: (old_states, actions, rewards, new_states, terminated)
+                - old_states (np.ndarray): Previous state of every mouse.
+                - actions (np.ndarray): Actions taken.
+                - rewards (np.ndarray): Reward of every mouse.
+                - new_states (np.ndarray): New state of every mouse.
+                - terminated (np.ndarray): Boolean array marking mice which found the cheese.
+        """
+        envs = np.arange(self.n_envs)
+        old_states = self.states
+        new_states = self.next_state[old_states, actions]
+        rewards = self.reward[old_states, actions]
+        terminated = self.done[old_states, actions]
+
+        # Unproductive movement
+        moved = ~self.crash[old_states, actions]
+        rewards[moved & ~terminated & self.vis[envs, new_states]] = GO_BACK_PENALTY
+        self.vis[envs[moved], new_states[moved]] = True
+
+        # Start new episodes of mice which won or lost too much
+        self.states = new_states.copy()
+        self.total_reward += rewards
+        finished = terminated | (self.total_reward < CRASH_PENALTY*self.vis.shape[1])
+        self.n_episodes += int(finished.sum())
+        self.reset(finished)
+
+        return old_states, actions, rewards, new_states, terminated
@@ -0,0 +1,154 @@
+"""
+Maze solver using Jump Point Search (JPS).
+
+This module solves a maze using A* algorithm which expands only jump points. Shortest paths on a
+4-connected grid are made canonical by going vertically first, so a horizontal move turns only
+where a wall forces it to. Straight runs of cells without such a turn are skipped in a single jump,
+which removes the symmetric paths through open areas and braided mazes.
+It can optionally display the maze solution step-by-step using pygame.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+from maze.app.consts import WALL, INF, FPS
+from maze.solution.path import Path
+import numpy as np
+import heapq
+
+def search(maze, start, goal):
+    """
+    Find the shortest path between two cells using Jump Point Search.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+        start (tuple): (row, col) of the start cell.
+        goal (tuple): (row, col) of the goal cell.
+
+    Returns:
+        Path: Path from the start to the goal, empty if the goal is unreachable.
+    """
+    n_rows, n_cols = maze.shape
+    free = (maze != WALL).reshape(-1)
+    source = start[0]*n_cols + start[1]
+    target = goal[0]*n_cols + goal[1]
+
+    def heuristic(cell):
+        row, col = divmod(cell, n_cols)
+        return abs(row - goal[0]) + abs(col - goal[1])
+
+    def forced(cell, change):
+        # Vertical neighbour which cannot be reached by going vertically first
+        return any(free[cell + side] and not free[cell + side - change] for side in (-n_cols, n_cols))
+
+    def jumpHorizontal(cell, change):
+        while True:
+            cell += change
+            if not free[cell]:
+                return
+            if cell == target or forced(cell, change):
+                return cell
+
+    def jumpVertical(cell, change):
+        while True:
+            cell += change
+            if not free[cell]:
+                return
+            if cell == target or jumpHorizontal(cell, -1) is not None or jumpHorizontal(cell, 1) is not None:
+                return cell
+
+    def successors(cell, change):
+        # Start cell goes in all directions
+        if change == 0:
+            return [(-n_cols, jumpVertical), (n_cols, jumpVertical), (-1, jumpHorizontal), (1, jumpHorizontal)]
+
+        # Vertical move may continue or turn to both sides
+        if abs(change) == n_cols:
+            return [(change, jumpVertical), (-1, jumpHorizontal), (1, jumpHorizontal)]
+
+        # Horizontal move may continue or turn only where it is forced
+        moves = [(change, jumpHorizontal)]
+        for side in (-n_cols, n_cols):
+            if free[cell + side] and not free[cell + side - change]:
+                moves.append((side, jumpVertical))
+        return moves
+
+    # Create required structures
+    dist = np.full(n_rows*n_cols, INF, dtype=np.int32)
+    came = np.full(n_rows*n_cols, -1, dtype=np.int32)
+    arrival = np.zeros(n_rows*n_cols, dtype=np.int32)
+    vis = np.zeros(n_rows*n_cols, dtype=np.bool_)
+
+    # Pick start node
+    h = heuristic(source)
+    dist[source] = 0
+    heap = [(h, h, source)]
+
+    while heap:
+        _, _, cell = heapq.heappop(heap)
+
+        # Reached the goal
+        if cell == target:
+            break
+
+        # Node already processed
+        if vis[cell]:
+            continue
+        vis[cell] = True
+
+        # Jump to the next jump points
+        for change, jump in successors(cell, int(arrival[cell])):
+            nxt = jump(cell, change)
+            if nxt is None:
+                continue
+
+            distance = int(dist[cell]) + abs(nxt - cell) // abs(change)
+            if distance < dist[nxt]:
+                dist[nxt] = distance
+                came[nxt] = cell
+                arrival[nxt] = change
+                h = heuristic(nxt)
+                heapq.heappush(heap, (distance + h, h, nxt))
+
+    # Goal is unreachable
+    if dist[target] == INF:
+        return Path([], maze.shape)
+
+    # Go back from the goal to the start filling the cells between jump points
+    cells = [target]
+    while cells[-1] != source:
+        cell = cells[-1]
+        change = int(arrival[cell])
+        cells.extend(range(cell - change, int(came[cell]) - change, -change))
+
+    return Path(cells[::-1], maze.shape)
+
+def solve(maze, screen=None, clock=None, start=None, goal=None):
+    """
+    Solve a maze using Jump Point Search.
+
+    Optionally display maze solution step on pygame screen.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+        screen (pygame.Surface, optional): Screen to draw maze. Defaults to None.
+        clock (pygame.time.Clock, optional): Clock controls the frame rate. Defaults to None.
+        start (tuple, optional): (row, col) of the start cell. Defaults to the top-left cell.
+        goal (tuple, optional): (row, col) of the goal cell. Defaults to the bottom-right cell.
+
+    Returns:
+        Path: Path from the start to the goal, its `toGrid` gives the 2D array of directions.
+    """
+    n_rows, n_cols = maze.shape
+    start = start or (1, 1)
+    goal = goal or (n_rows-2, n_cols-2)
+
+    # Save path from start to end
+    path = search(maze, start, goal)
+
+    # Visualize solution
+    if screen:
+        from maze.app.animation import animatePath
+        if not animatePath(screen, clock, maze, path, FPS):
+            return
+
+    return path
@@ -0,0 +1,309 @@
+"""
+Maze solver using a graph of junctions.
+
+Most cells of a maze are corridor cells with exactly two open neighbours. This module contracts
+every corridor into a single weighted edge between junctions and dead ends, stores the graph in
+compressed sparse row (CSR) form and runs dijkstra's algorithm on it. The graph depends only on
+the maze, so it can be built once and reused: a start or goal inside a corridor is joined to the
+graph for a single query by walking to the two nodes at the ends of its corridor. The path found
+in the graph is expanded back into maze cells by walking the corridors.
+It can optionally display the maze solution step-by-step using pygame.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+from maze.app.consts import WALL, INF, FPS
+from maze.solution.path import Path, steps
+import numpy as np
+import heapq
+
+class JunctionGraph:
+    """
+    Graph of junctions and dead ends connected by corridors.
+
+    The graph depends only on the maze, so it can be built once and reused for many queries
+    between any free cells.
+
+    Attributes:
+        shape (tuple): (n_rows, n_cols) of the maze.
+        free (np.ndarray): Flat boolean array of free cells.
+        cells (np.ndarray): int32 array with the flat cell index of every node.
+        node (np.ndarray): Flat int32 array with the node index of every cell, -1 for other cells.
+        indptr (np.ndarray): int32 array, edges of node i are indptr[i]:indptr[i+1].
+        targets (np.ndarray): int32 array with the node at the other end of every edge.
+        weights (np.ndarray): int32 array with the length of every edge.
+        firsts (np.ndarray): int32 array with the first cell of every edge after its node.
+    """
+
+    def __init__(self, maze):
+        """
+        Build the graph of a maze.
+
+        Args:
+            maze (np.ndarray): 2D array representing the maze.
+        """
+        n_rows, n_cols = maze.shape
+        free = maze != WALL
+        self.shape = maze.shape
+        self.free = free.reshape(-1)
+
+        # Count open neighbours of every cell
+        degree = np.zeros(maze.shape, dtype=np.int8)
+        degree[1:] += free[:-1]
+        degree[:-1] += free[1:]
+        degree[:, 1:] += free[:, :-1]
+        degree[:, :-1] += free[:, 1:]
+
+        # Every free cell which is not inside a corridor becomes a node
+        is_node = self.free & (degree.reshape(-1) != 2)
+
+        self.cells = np.flatnonzero(is_node).astype(np.int32)
+        self.node = np.full(n_rows*n_cols, -1, dtype=np.int32)
+        self.node[self.cells] = np.arange(len(self.cells), dtype=np.int32)
+
+        # Walk every corridor leaving every node
+        indptr, targets, weights, firsts = [0], [], [], []
+        for cell in self.cells.tolist():
+            for _, change in steps(n_cols):
+                if not self.free[cell + change]:
+                    continue
+
+                end, length = self.__walk(cell, change)
+                targets.append(self.node[end])
+                weights.append(length)
+                firsts.append(cell + change)
+            indptr.append(len(targets))
+
+        self.indptr = np.array(indptr, dtype=np.int32)
+        self.targets = np.array(targets, dtype=np.int32)
+        self.weights = np.array(weights, dtype=np.int32)
+        self.firsts = np.array(firsts, dtype=np.int32)
+
+    def search(self, start, goal):
+        """
+        Find the shortest path between two free cells using dijkstra's algorithm.
+
+        Cells inside corridors are joined to the graph for this query only, by edges to the nodes
+        at both ends of their corridor.
+
+        Args:
+            start (tuple): (row, col) of the start cell.
+            goal (tuple): (row, col) of the goal cell.
+
+        Returns:
+            Path: Path from the start to the goal, empty if the goal is unreachable.
+
+        Raises:
+            ValueError: If the start or the goal is a wall.
+        """
+        n_cols = self.shape[1]
+        source = int(start[0]*n_cols + start[1])
+        target = int(goal[0]*n_cols + goal[1])
+        if not self.free[source] or not self.free[target]:
+            raise ValueError('Start and goal must be free cells')
+
+        if source == target:
+            return Path([source], self.shape)
+
+        # Walks from the start and the goal to the nodes at the ends of their corridors
+        heads, tails = self.__leave(source), self.__leave(target)
+        best, best_node = INF, -1
+
+        # Goal lies on the corridor of the start
+        for head in heads:
+            if target in head and head.index(target) + 1 < best:
+                best, direct = head.index(target) + 1, [source] + head[:head.index(target) + 1]
+
+        # Temporary edges from the goal corridor into the goal
+        into_goal = {}
+        for j, tail in enumerate(tails):
+            node = int(self.node[tail[-1]]) if tail else int(self.node[target])
+            if node != -1 and (node not in into_goal or len(tail) < into_goal[node][0]):
+                into_goal[node] = (len(tail), j)
+
+        # Plain lists are faster than arrays for scalar access
+        indptr, targets, weights = self.indptr.tolist(), self.targets.tolist(), self.weights.tolist()
+
+        # Create required structures
+        dist = [INF] * len(self.cells)
+        came = [-1] * len(self.cells)
+        prev = [-1] * len(self.cells)
+        heap = []
+
+        # Temporary edges from the start into its corridor nodes
+        entry = {}
+        for i, head in enumerate(heads):
+            node = int(self.node[head[-1]]) if head else int(self.node[source])
+            if node != -1 and len(head) < dist[node]:
+                dist[node] = len(head)
+                entry[node] = i
+                heapq.heappush(heap, (len(head), node))
+
+        while heap:
+            distance, node = heapq.heappop(heap)
+
+            # No shorter path to the goal is left
+            if distance >= best:
+                break
+
+            # Node already processed with a shorter distance
+            if distance > dist[node]:
+                continue
+
+            # Goal is reached through this node
+            if node in into_goal and distance + into_goal[node][0] < best:
+                best, best_node = distance + into_goal[node][0], node
+
+            # Update nodes at the other end of corridors
+            for edge in range(indptr[node], indptr[node+1]):
+                nxt = targets[edge]
+                if distance + weights[edge] < dist[nxt]:
+                    dist[nxt] = distance + weights[edge]
+                    came[nxt], prev[nxt] = edge, node
+                    heapq.heappush(heap, (dist[nxt], nxt))
+
+        # Goal is unreachable
+        if best == INF:
+            return Path([], self.shape)
+
+        # Path along a single corridor
+        if best_node == -1:
+            return Path(direct, self.shape, best)
+
+        # Collect edges from the goal back to the first node
+        edges = []
+        node = best_node
+        while prev[node] != -1:
+            edges.append(came[node])
+            node = prev[node]
+
+        # Join the walk from the start, the corridors and the walk into the goal
+        cells = [source] + heads[entry[node]]
+        cells += self.expand(edges[::-1], cells[-1])[1:].tolist()
+        tail = tails[into_goal[best_node][1]]
+        if tail:
+            cells += tail[-2::-1] + [target]
+
+        return Path(cells, self.shape, best)
+
+    def expand(self, edges, start):
+        """
+        Expand a sequence of edges into maze cells.
+
+        Args:
+            edges (list): Edge indices forming a path in the graph.
+            start (int): Flat index of the cell where the path starts.
+
+        Returns:
+            np.ndarray: int32 array of flat cell indices.
+        """
+        cells = [start]
+
+        for edge in edges:
+            end = int(self.cells[self.targets[edge]])
+            change = int(self.firsts[edge]) - cells[-1]
+
+            # Follow the corridor to its end
+            cells.append(cells[-1] + change)
+            while cells[-1] != end:
+                change = self.__turn(cells[-1], change)
+                cells.append(cells[-1] + change)
+
+        return np.array(cells, dtype=np.int32)
+
+    def __walk(self, cell, change):
+        """
+        Follow a corridor from a node until the next node.
+
+        Args:
+            cell (int): Flat index of the node.
+            change (int): Change of the flat index of the first move.
+
+        Returns:
+            tuple: (end, length) flat index of the node at the end and the length of the corridor.
+        """
+        cell += change
+        length = 1
+        while self.node[cell] == -1:
+            change = self.__turn(cell, change)
+            cell += change
+            length += 1
+
+        return cell, length
+
+    def __leave(self, cell):
+        """
+        Walk from a cell to the nodes at the ends of its corridor.
+
+        Args:
+            cell (int): Flat index of a free cell.
+
+        Returns:
+            list: Lists of flat indices visited after the cell, one for every direction, each ending
+                  at a node or back at the cell if the corridor is a loop without nodes. A node gives
+                  a single empty walk.
+        """
+        if self.node[cell] != -1:
+            return [[]]
+
+        walks = []
+        for _, change in steps(self.shape[1]):
+            if not self.free[cell + change]:
+                continue
+
+            # Follow the corridor until a node or back to the cell
+            walk = [cell + change]
+            while self.node[walk[-1]] == -1 and walk[-1] != cell:
+                change = self.__turn(walk[-1], change)
+                walk.append(walk[-1] + change)
+            walks.append(walk)
+
+        return walks
+
+    def __turn(self, cell, change):
+        """
+        Find the direction in which a corridor continues.
+
+        Args:
+            cell (int): Flat index of a corridor cell.
+            change (int): Change of the flat index of the move into the cell.
+
+        Returns:
+            int: Change of the flat index of the next move.
+        """
+        for _, step in steps(self.shape[1]):
+            if step != -change and self.free[cell + step]:
+                return step
+
+def solve(maze, screen=None, clock=None, start=None, goal=None, graph=None):
+    """
+    Solve a maze using the graph of junctions.
+
+    Optionally display maze solution step on pygame screen.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+        screen (pygame.Surface, optional): Screen to draw maze. Defaults to None.
+        clock (pygame.time.Clock, optional): Clock controls the frame rate. Defaults to None.
+        start (tuple, optional): (row, col) of the start cell. Defaults to the top-left cell.
+        goal (tuple, optional): (row, col) of the goal cell. Defaults to the bottom-right cell.
+        graph (JunctionGraph, optional): Graph of the maze built earlier. Defaults to None.
+
+    Returns:
+        Path: Path from the start to the goal, its `toGrid` gives the 2D array of directions.
+    """
+    n_rows, n_cols = maze.shape
+    start = start or (1, 1)
+    goal = goal or (n_rows-2, n_cols-2)
+    graph = graph or JunctionGraph(maze)
+
+    # Save path from start to end
+    path = graph.search(start, goal)
+
+    # Visualize solution
+    if screen:
+        from maze.app.animation import animatePath
+        if not animatePath(screen, clock, maze, path, FPS):
+            return
+
+    return path
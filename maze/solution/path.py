@@ -0,0 +1,201 @@
+"""
+Maze path helpers.
+
+This module contains helpers shared by the maze solvers. Solvers store for every cell the
+move leading towards the goal (UP, DOWN, LEFT, RIGHT or -1) in a flat int8 array, and the
+path is a sequence of flat cell indices from the start to the goal.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+from maze.app.consts import UP, DOWN, LEFT, RIGHT
+import numpy as np
+import struct
+
+# Serialized path header: rows, columns, cost
+HEADER = struct.Struct('<IIq')
+
+def steps(n_cols):
+    """
+    Return the change of the flat cell index for every move.
+
+    Args:
+        n_cols (int): Number of maze columns.
+
+    Returns:
+        tuple: Pairs (move, change) for UP, DOWN, LEFT and RIGHT.
+    """
+    return ((UP, -n_cols), (DOWN, n_cols), (LEFT, -1), (RIGHT, 1))
+
+def trace(moves, start, n_cols):
+    """
+    Follow the moves from the start until a cell without a move is reached.
+
+    Args:
+        moves (np.ndarray): Flat int8 array of moves towards the goal, -1 if there is none.
+        start (int): Flat index of the start cell.
+        n_cols (int): Number of maze columns.
+
+    Returns:
+        np.ndarray: int32 array of flat cell indices from the start to the goal.
+    """
+    changes = dict(steps(n_cols))
+    cells = [start]
+    cell = start
+
+    while moves[cell] != -1:
+        cell += changes[int(moves[cell])]
+        cells.append(cell)
+
+    return np.array(cells, dtype=np.int32)
+
+def directions(cells, n_cols):
+    """
+    Compute the move made from every cell of the path to the next one.
+
+    Args:
+        cells (np.ndarray): Flat cell indices of the path.
+        n_cols (int): Number of maze columns.
+
+    Returns:
+        np.ndarray: int8 array of moves, one shorter than the path.
+    """
+    change = np.diff(cells.astype(np.int64))
+    moves = np.full(len(change), -1, dtype=np.int8)
+
+    for move, step in steps(n_cols):
+        moves[change == step] = move
+    return moves
+
+def toGrid(shape, cells):
+    """
+    Convert a path to a 2D array of directions as drawn by `maze.app.visualizer.drawPath`.
+
+    Every cell of the path except the start and the goal holds the move to the next cell,
+    all other cells hold None.
+
+    Args:
+        shape (tuple): (n_rows, n_cols) of the maze.
+        cells (np.ndarray): Flat cell indices of the path.
+
+    Returns:
+        np.ndarray: 2D array representing the path.
+    """
+    path = np.full(shape, None)
+    flat = path.reshape(-1)
+
+    moves = directions(cells, shape[1])
+    flat[cells[1:-1]] = moves[1:].tolist()
+    return path
+
+class Path:
+    """
+    Path found by a solver.
+
+    The path keeps only the flat cell indices, the 2D array of directions drawn by
+    `maze.app.visualizer.drawPath` is created on first use and cached, but not pickled.
+
+    Attributes:
+        cells (np.ndarray): int32 array of flat cell indices from the start to the goal, empty if there is no path.
+        shape (tuple): (n_rows, n_cols) of the maze.
+        length (int): Number of moves of the path.
+        cost (int): Cost of the path, the number of moves unless given.
+    """
+
+    def __init__(self, cells, shape, cost=None):
+        """
+        Create a path.
+
+        Args:
+            cells (np.ndarray): Flat cell indices from the start to the goal.
+            shape (tuple): (n_rows, n_cols) of the maze.
+            cost (int, optional): Cost of the path. Defaults to the number of moves.
+        """
+        self.cells = np.asarray(cells, dtype=np.int32)
+        self.shape = tuple(int(size) for size in shape)
+        self.length = max(len(self.cells) - 1, 0)
+        self.cost = self.length if cost is None else int(cost)
+        self.__grid = None
+
+    @classmethod
+    def fromBytes(cls, data):
+        """
+        Read a path written by `toBytes`.
+
+        Args:
+            data (bytes): Serialized path.
+
+        Returns:
+            Path: The path.
+        """
+        n_rows, n_cols, cost = HEADER.unpack_from(data)
+        cells = np.frombuffer(data, dtype='<i4', offset=HEADER.size)
+        return cls(cells, (n_rows, n_cols), cost)
+
+    def toBytes(self):
+        """
+        Serialize the path.
+
+        Returns:
+            bytes: Header followed by the little-endian int32 cell indices.
+        """
+        return HEADER.pack(*self.shape, self.cost) + self.cells.astype('<i4').tobytes()
+
+    def found(self):
+        """
+        Check whether the goal was reached.
+
+        Returns:
+            bool: False if the path is empty.
+        """
+        return len(self.cells) > 0
+
+    def positions(self):
+        """
+        Convert the path to cell positions.
+
+        Returns:
+            np.ndarray: 2D int32 array of (row, col) pairs.
+        """
+        return np.stack(np.divmod(self.cells, self.shape[1]), axis=1)
+
+    def moves(self):
+        """
+        Compute the move made from every cell of the path to the next one.
+
+        Returns:
+            np.ndarray: int8 array of moves, one shorter than the path.
+        """
+        return directions(self.cells, self.shape[1])
+
+    def toGrid(self):
+        """
+        Convert the path to a 2D array of directions, see `toGrid`.
+
+        Returns:
+            np.ndarray: 2D array representing the path.
+        """
+        if self.__grid is None:
+            self.__grid = toGrid(self.shape, self.cells)
+        return self.__grid
+
+    def __getstate__(self):
+        # Cached grid is as large as the maze, it is rebuilt on demand
+        state = self.__dict__.copy()
+        state['_Path__grid'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__grid = None
+
+    def __eq__(self, other):
+        if not isinstance(other, Path):
+            return NotImplemented
+        return self.shape == other.shape and self.cost == other.cost and np.array_equal(self.cells, other.cells)
+
+    def __hash__(self):
+        return hash((self.shape, self.cost, self.cells.tobytes()))
+
+    def __repr__(self):
+        return f'Path(length={self.length}, cost={self.cost}, shape={self.shape})'
@@ -7,30 +7,77 @@ It can optionally display the maze solution step-by-step using pygame.
 Author: Michał Zientek
 Date: 2025-08-22
 """
-from maze.app.consts import LEARNING_RATE, GAMMA, N_ROWS, N_COLS, MIN_EPSILON, DECAY_RATE, CRASH_PENALTY, WIN_PRIZE, UP, DOWN, LEFT, RIGHT, FPS, QLEARNING_FPS
-from maze.app.visualizer import drawPath
-from collections import deque
+from maze.app.consts import LEARNING_RATE, GAMMA, N_ROWS, N_COLS, MIN_EPSILON, DECAY_RATE, CRASH_PENALTY, WIN_PRIZE, FPS, QLEARNING_FPS, BATCH_SIZE, WALL, CHEESE, INF, QTABLE_DIR
+from maze.solution.path import Path, steps, trace
+from maze.solution.cache import digest
 import maze.solution.env as env
 import numpy as np
 import random
-import pygame
+import os
 
 class QTable:
     """
     Q-Table implementation for tabular Q-learning.
 
     Attributes:
+        shape (tuple): (n_rows, n_cols) of the maze.
         q_val (np.ndarray): 2D array storing Q-values for each state-action pair.
-                            Shape: (N_ROWS * N_COLS, 4), where 4 = number of actions.
+                            Shape: (n_rows * n_cols, 4), where 4 = number of actions.
     """
 
-    def __init__(self):
+    def __init__(self, shape=(N_ROWS, N_COLS)):
         """
         Initializes the Q-table with zeros.
         Each state corresponds to a maze cell (row, col) mapped to a single index.
         Each action corresponds to a movement (UP, DOWN, LEFT, RIGHT).
+
+        Args:
+            shape (tuple, optional): (n_rows, n_cols) of the maze. Defaults to (N_ROWS, N_COLS).
+        """
+        self.shape = tuple(shape)
+        self.q_val = np.zeros((self.shape[0] * self.shape[1], 4))
+
+    @classmethod
+    def load(cls, path, shape, mmap_mode='c'):
+        """
+        Reads Q-values saved by `save`.
+
+        The file is memory-mapped, so only the pages of states in use are read. With the default
+        copy-on-write mode the table can be trained further without changing the file.
+
+        Args:
+            path (str): Path of the `.npy` file.
+            shape (tuple): (n_rows, n_cols) of the maze.
+            mmap_mode (str, optional): Mode of `numpy.load`, None to read the whole file. Defaults to 'c'.
+
+        Returns:
+            QTable: The loaded Q-table.
+
+        Raises:
+            ValueError: If the saved table does not fit the maze shape.
+        """
+        q_val = np.load(path, mmap_mode=mmap_mode)
+        if q_val.shape != (shape[0] * shape[1], 4):
+            raise ValueError(f'Q-table of shape {q_val.shape} does not fit a maze of shape {tuple(shape)}')
+
+        qtable = cls.__new__(cls)
+        qtable.shape = tuple(shape)
+        qtable.q_val = q_val
+        return qtable
+
+    def save(self, path):
         """
-        self.q_val = np.zeros((N_ROWS * N_COLS, 4))
+        Writes the Q-values to a `.npy` file, creating its directory.
+
+        The file is replaced at once, so tables memory-mapped from the old file stay valid.
+
+        Args:
+            path (str): Path of the `.npy` file.
+        """
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path + '.tmp', 'wb') as file:
+            np.save(file, np.asarray(self.q_val))
+        os.replace(path + '.tmp', path)
     
     def state(self, row, col):
         """
@@ -43,7 +90,7 @@ class QTable:
         Returns:
             int: Flattened state index for Q-table lookup.
         """
-        return N_COLS * row + col
+        return self.shape[1] * row + col
 
     def best_action(self, state):
         """
@@ -70,31 +117,236 @@ class QTable:
             next_state (int): State index after taking the action.
         """
         self.q_val[state][action] += LEARNING_RATE * (
-            reward + GAMMA * self.q_val[next_state].max()
+            reward + GAMMA * self.q_val[next_state].max() - self.q_val[state][action]
         )
 
-def solve(maze, screen=None, clock=None):
+    def updateBatch(self, states, actions, rewards, next_states, terminated=None):
+        """
+        Updates many state-action pairs at once using the same rule as `update`.
+
+        All targets are computed from the table before the batch. Pairs occurring several times
+        in the batch move towards the mean of their targets, so repeated pairs do not overshoot.
+
+        Args:
+            states (np.ndarray): Current state indices.
+            actions (np.ndarray): Actions taken at the current states.
+            rewards (np.ndarray): Immediate rewards received after taking the actions.
+            next_states (np.ndarray): State indices after taking the actions.
+            terminated (np.ndarray, optional): Boolean array marking transitions into the cheese,
+                                               their targets skip the future reward. Defaults to None.
+        """
+        future = self.q_val[next_states].max(axis=1)
+        if terminated is not None:
+            future = np.where(terminated, 0.0, future)
+
+        change = LEARNING_RATE * (rewards + GAMMA * future - self.q_val[states, actions])
+        _, inverse, counts = np.unique(states*4 + actions, return_inverse=True, return_counts=True)
+        np.add.at(self.q_val, (states, actions), change / counts[inverse])
+
+    def greedyPath(self, maze, start=(1, 1), goal=None):
+        """
+        Follows the best actions from the start.
+
+        Args:
+            maze (np.ndarray): 2D array representing the maze.
+            start (tuple, optional): (row, col) of the start cell. Defaults to (1, 1).
+            goal (tuple, optional): (row, col) of the cheese. Defaults to the bottom-right cell.
+
+        Returns:
+            Path: Path to the cheese, empty if the policy hits a wall or goes in circles.
+        """
+        n_rows, n_cols = maze.shape
+        goal = goal or (n_rows-2, n_cols-2)
+        free = (maze != WALL).reshape(-1)
+        changes = dict(steps(n_cols))
+
+        cell, target = self.state(*start), self.state(*goal)
+        cells = [cell]
+        seen = {cell}
+
+        while cell != target:
+            cell += changes[int(self.best_action(cell))]
+            if not free[cell] or cell in seen:
+                return Path([], maze.shape)
+            cells.append(cell)
+            seen.add(cell)
+
+        return Path(cells, maze.shape)
+
+    def replay(self, buffer, batch_size=BATCH_SIZE, n_batches=1):
+        """
+        Updates the Q-values from random minibatches of remembered transitions.
+
+        Args:
+            buffer (ReplayBuffer): Memory of transitions.
+            batch_size (int, optional): Number of transitions in a minibatch. Defaults to BATCH_SIZE.
+            n_batches (int, optional): Number of minibatches. Defaults to 1.
+        """
+        for _ in range(n_batches):
+            self.updateBatch(*buffer.sample(batch_size))
+
+def train(maze, screen=None, clock=None, n_envs=64, max_episodes=100_000, max_steps=10_000, tolerance=0.01,
+          check_every=100, render_every=None, qtable=None, seed=None, buffer=None, n_batches=1):
+    """
+    Train a Q-table with many mice moving through the maze at once, without drawing every step.
+
+    Every step all mice pick an epsilon-greedy action, and the whole batch of transitions
+    updates the table with `QTable.updateBatch`. With a replay buffer the transitions are
+    remembered instead, and the table learns from random minibatches of the memory.
+
+    Training stops when the episode or step budget runs out, or when the table converged: every
+    `check_every` steps the mean absolute change of the Q-values of free cells is compared with
+    `tolerance` and the greedy policy has to lead from the start to the cheese.
+
+    Optionally display the greedy path on pygame screen every `render_every` finished episodes.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+        screen (pygame.Surface, optional): Screen to draw maze. Defaults to None.
+        clock (pygame.time.Clock, optional): Clock controls the frame rate. Defaults to None.
+        n_envs (int, optional): Number of mice. Defaults to 64.
+        max_episodes (int, optional): Budget of finished episodes of all mice. Defaults to 100_000.
+        max_steps (int, optional): Budget of steps of all mice. Defaults to 10_000.
+        tolerance (float, optional): Mean change of Q-values counted as converged, None to train until
+                                     a budget runs out. Defaults to 0.01.
+        check_every (int, optional): Number of steps between convergence checks. Defaults to 100.
+        render_every (int, optional): Number of episodes between drawings. Defaults to None.
+        qtable (QTable, optional): Table to continue training. Defaults to a new table.
+        seed (int, optional): Seed of the random generator. Defaults to None.
+        buffer (ReplayBuffer, optional): Memory of transitions used for replay. Defaults to None.
+        n_batches (int, optional): Number of replayed minibatches per step. Defaults to 1.
+
+    Returns:
+        tuple: (qtable, converged), or None if the user closed the window.
+            - qtable (QTable): Trained Q-table.
+            - converged (bool): Whether training stopped because the table converged.
+    """
+    qmaze = env.VectorQMaze(maze, n_envs)
+    qtable = qtable if qtable is not None else QTable(maze.shape)
+    rng = np.random.default_rng(seed)
+    free = (maze != WALL).reshape(-1)
+    previous = qtable.q_val[free]
+    epsilon = 1.0
+    drawn = 0
+
+    for step in range(1, max_steps + 1):
+        # Exploitation, with exploration for some mice
+        actions = qtable.q_val[qmaze.states].argmax(axis=1)
+        explore = rng.random(n_envs) < epsilon
+        actions[explore] = rng.integers(0, 4, explore.sum())
+        epsilon = max(MIN_EPSILON, epsilon - DECAY_RATE)
+
+        # Perform actions
+        transitions = qmaze.step(actions)
+        if buffer is None:
+            qtable.updateBatch(*transitions)
+        else:
+            buffer.extend(*transitions)
+            qtable.replay(buffer, n_batches=n_batches)
+
+        # Draw GUI
+        if screen and render_every and qmaze.n_episodes - drawn >= render_every:
+            from maze.app.visualizer import drawPath
+            import pygame
+            drawn = qmaze.n_episodes
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return
+            drawPath(screen, maze, qtable.greedyPath(maze).toGrid())
+            pygame.display.flip()
+            clock.tick(QLEARNING_FPS)
+
+        # Episode budget ran out
+        if qmaze.n_episodes >= max_episodes:
+            break
+
+        # Q-values stopped changing and lead to the cheese
+        if tolerance is not None and step % check_every == 0:
+            current = qtable.q_val[free]
+            change = np.abs(current - previous).mean()
+            previous = current
+            if change < tolerance and qtable.greedyPath(maze).found():
+                return qtable, True
+
+    return qtable, False
+
+def learn(maze, n_envs=256, n_steps=1000, qtable=None, seed=None, buffer=None, n_batches=1):
+    """
+    Train a Q-table for a fixed number of steps, see `train`.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+        n_envs (int, optional): Number of mice. Defaults to 256.
+        n_steps (int, optional): Number of steps of all mice. Defaults to 1000.
+        qtable (QTable, optional): Table to continue training. Defaults to a new table.
+        seed (int, optional): Seed of the random generator. Defaults to None.
+        buffer (ReplayBuffer, optional): Memory of transitions used for replay. Defaults to None.
+        n_batches (int, optional): Number of replayed minibatches per step. Defaults to 1.
+
+    Returns:
+        QTable: Trained Q-table.
+    """
+    qtable, _ = train(maze, n_envs=n_envs, max_episodes=INF, max_steps=n_steps, tolerance=None,
+                      qtable=qtable, seed=seed, buffer=buffer, n_batches=n_batches)
+    return qtable
+
+def tablePath(maze, directory=QTABLE_DIR, goal=None):
+    """
+    Return the file of the Q-table of a maze.
+
+    Tables are keyed by a hash of the walls and by the cheese cell, since the Q-values lead
+    towards the cheese. The position of the mouse does not matter.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+        directory (str, optional): Directory of saved Q-tables. Defaults to QTABLE_DIR.
+        goal (tuple, optional): (row, col) of the cheese. Defaults to the cheese cell of the maze,
+                                or the bottom-right cell if the maze has none.
+
+    Returns:
+        str: Path of the `.npy` file.
+    """
+    if goal is None:
+        cheese = np.argwhere(maze == CHEESE)
+        goal = tuple(cheese[0]) if len(cheese) else (maze.shape[0]-2, maze.shape[1]-2)
+
+    return os.path.join(directory, f'{digest(maze != WALL)}-{goal[0]}-{goal[1]}.npy')
+
+def solve(maze, screen=None, clock=None, warm_start=False, directory=QTABLE_DIR):
     """
     Solve a maze using Q-learning tables.
 
     Optionally display maze solution step on pygame screen.
+
+    With a warm start the training continues from a copy of the Q-table saved for this maze, or of
+    the given table e.g. of a slightly modified maze, and exploits it from the first step. The trained
+    table is saved for the next solve.
     
     Args:
         maze (np.ndarray): 2D array representing the maze.
         screen (pygame.Surface, optional): Screen to draw maze. Defaults to None.
         clock (pygame.time.Clock, optional): Clock controls the frame rate. Defaults to None.
+        warm_start (bool | QTable, optional): Whether to start from a saved table, or the table to start from. Defaults to False.
+        directory (str, optional): Directory of saved Q-tables. Defaults to QTABLE_DIR.
 
     Returns:
-        np.ndarray: 2D array representing the path.        
+        Path: Path from the start to the goal, its `toGrid` gives the 2D array of directions.
     """
     # Initialize structures
     qmaze = env.QMaze(maze)
-    qtable = QTable()
-    path = np.full(maze.shape, None)
+    qtable = QTable(maze.shape)
+    epsilon = 1.0
+
+    # Continue from an earlier table
+    if warm_start:
+        table_file = tablePath(maze, directory)
+        if isinstance(warm_start, QTable):
+            qtable.q_val[:], epsilon = warm_start.q_val, MIN_EPSILON
+        elif os.path.exists(table_file):
+            qtable.q_val[:], epsilon = QTable.load(table_file, maze.shape).q_val, MIN_EPSILON
 
     # Initialize parameters
     total_reward = 0.0
-    epsilon = 1.0
     running = True
 
     # Infinitive number of episodes
@@ -124,6 +376,7 @@ def solve(maze, screen=None, clock=None):
         
         # Draw GUI
         if screen:
+            import pygame
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     return
@@ -134,44 +387,19 @@ def solve(maze, screen=None, clock=None):
     # Reset positions
     qmaze.updateMousePosition(1, 1)
     qmaze.respawnCheese()
+
+    # Keep table for the next solve
+    if warm_start:
+        qtable.save(table_file)
     
     # Save path from start to end
-    path = np.full(maze.shape, None)
-    stck = deque()
-    stck.append((1, 1))
+    moves = np.where(qmaze.path == None, -1, qmaze.path).astype(np.int8)
+    path = Path(trace(moves.reshape(-1), qtable.state(1, 1), maze.shape[1]), maze.shape)
 
-    while len(stck):
-        row, col = stck.pop()
-        
-        # Save movement
-        if qmaze.path[row][col] == UP:
-            stck.append((row-1, col))
-            path[row][col] = UP
-        
-        elif qmaze.path[row][col] == DOWN:
-            stck.append((row+1, col))
-            path[row][col] = DOWN
-        
-        elif qmaze.path[row][col] == LEFT:
-            stck.append((row, col-1))
-            path[row][col] = LEFT
-        
-        elif qmaze.path[row][col] == RIGHT:
-            stck.append((row, col+1))
-            path[row][col] = RIGHT
-
-        # Remove arrow from mouse cell
-        if row == 1 and col == 1:
-            path[1][1] = None
+    # Visualize solution
+    if screen:
+        from maze.app.animation import animatePath
+        if not animatePath(screen, clock, maze, path, FPS):
+            return
 
-        # Visualize solution
-        if screen:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return
-            drawPath(screen, maze, path)
-            pygame.display.flip()
-            clock.tick(FPS)
-    
     return path
-    
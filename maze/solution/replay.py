@@ -0,0 +1,123 @@
+"""
+Experience replay memory.
+
+This module stores the transitions collected by Q-learning mice, so every transition can be
+learned from many times. The memory is a ring of preallocated arrays: adding a transition
+overwrites the oldest one once the memory is full, and minibatches are drawn with a single
+random index array.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+from maze.app.consts import MAX_MEMORY, BATCH_SIZE
+import numpy as np
+
+class ReplayBuffer:
+    """
+    Ring buffer of transitions (state, action, reward, next_state, terminated).
+
+    Attributes:
+        capacity (int): Maximum number of transitions.
+        size (int): Number of stored transitions.
+        head (int): Index where the next transition is written.
+        states (np.ndarray): int32 array of states.
+        actions (np.ndarray): int8 array of actions.
+        rewards (np.ndarray): float64 array of rewards.
+        next_states (np.ndarray): int32 array of states after the actions.
+        terminated (np.ndarray): Boolean array marking transitions into the cheese.
+        rng (np.random.Generator): Random generator used for sampling.
+    """
+
+    def __init__(self, capacity=MAX_MEMORY, seed=None):
+        """
+        Allocate an empty buffer.
+
+        Args:
+            capacity (int, optional): Maximum number of transitions. Defaults to MAX_MEMORY.
+            seed (int, optional): Seed of the random generator. Defaults to None.
+        """
+        self.capacity = capacity
+        self.size = 0
+        self.head = 0
+        self.states = np.empty(capacity, dtype=np.int32)
+        self.actions = np.empty(capacity, dtype=np.int8)
+        self.rewards = np.empty(capacity, dtype=np.float64)
+        self.next_states = np.empty(capacity, dtype=np.int32)
+        self.terminated = np.empty(capacity, dtype=np.bool_)
+        self.rng = np.random.default_rng(seed)
+
+    def __len__(self):
+        return self.size
+
+    def push(self, state, action, reward, next_state, terminated):
+        """
+        Add a single transition, overwriting the oldest one if the buffer is full.
+
+        Args:
+            state (int): Current state index.
+            action (int): Action taken at the current state.
+            reward (float): Immediate reward received after taking the action.
+            next_state (int): State index after taking the action.
+            terminated (bool): Whether the action reached the cheese.
+        """
+        i = self.head
+        self.states[i] = state
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_states[i] = next_state
+        self.terminated[i] = terminated
+
+        self.head = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def extend(self, states, actions, rewards, next_states, terminated):
+        """
+        Add a batch of transitions, e.g. one step of `maze.solution.env.VectorQMaze`.
+
+        Args:
+            states (np.ndarray): Current state indices.
+            actions (np.ndarray): Actions taken at the current states.
+            rewards (np.ndarray): Immediate rewards received after taking the actions.
+            next_states (np.ndarray): State indices after taking the actions.
+            terminated (np.ndarray): Boolean array marking transitions into the cheese.
+        """
+        n = len(states)
+
+        # Only the newest transitions fit into the buffer
+        if n > self.capacity:
+            skip = n - self.capacity
+            self.head = (self.head + skip) % self.capacity
+            states, actions, rewards = states[skip:], actions[skip:], rewards[skip:]
+            next_states, terminated = next_states[skip:], terminated[skip:]
+            n = self.capacity
+
+        # Write positions wrap around the end of the ring
+        index = (self.head + np.arange(n)) % self.capacity
+        self.states[index] = states
+        self.actions[index] = actions
+        self.rewards[index] = rewards
+        self.next_states[index] = next_states
+        self.terminated[index] = terminated
+
+        self.head = (self.head + n) % self.capacity
+        self.size = min(self.size + n, self.capacity)
+
+    def sample(self, batch_size=BATCH_SIZE):
+        """
+        Draw a random minibatch of stored transitions with replacement.
+
+        Args:
+            batch_size (int, optional): Number of transitions. Defaults to BATCH_SIZE.
+
+        Returns:
+            tuple: (states, actions, rewards, next_states, terminated) arrays of length `batch_size`.
+
+        Raises:
+            ValueError: If the buffer is empty.
+        """
+        if self.size == 0:
+            raise ValueError('Cannot sample from an empty replay buffer')
+
+        index = self.rng.integers(0, self.size, batch_size)
+        return (self.states[index], self.actions[index], self.rewards[index],
+                self.next_states[index], self.terminated[index])
@@ -0,0 +1,211 @@
+"""
+Maze solver using a precomputed tree index.
+
+Mazes created by the DFS, Kruskal and Prim generators are perfect: there is exactly one path
+between any two cells, so the maze is a tree. This module roots the tree once and builds a
+binary lifting table of ancestors. The lowest common ancestor (LCA) of two cells then gives the
+length of the path between them in O(log n) and the path itself in O(path length).
+It can optionally display the maze solution step-by-step using pygame.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+from maze.app.consts import WALL, INF, FPS
+from maze.solution.path import Path, steps
+from maze.solution.wavefront import distances
+import numpy as np
+
+class TreeIndex:
+    """
+    Index answering path queries on a perfect maze.
+
+    Only free cells are indexed: they are numbered in the order of their flat indices, and all
+    arrays below are indexed by these numbers. Positions are converted at the boundary.
+
+    Attributes:
+        shape (tuple): (n_rows, n_cols) of the maze.
+        root (int): Flat index of the root cell.
+        cells (np.ndarray): Sorted int32 array with the flat index of every free cell.
+        depth (np.ndarray): int32 array with the distance of every free cell to the root.
+        up (np.ndarray): 2D int32 array where up[k][i] is the number of the 2^k-th ancestor of cell i.
+    """
+
+    def __init__(self, maze, root=(1, 1)):
+        """
+        Build the index of a perfect maze.
+
+        Args:
+            maze (np.ndarray): 2D array representing the maze.
+            root (tuple, optional): (row, col) of the root cell. Defaults to (1, 1).
+
+        Raises:
+            ValueError: If the free cells of the maze do not form a tree.
+        """
+        n_rows, n_cols = maze.shape
+        free = maze != WALL
+
+        # Tree has one edge less than nodes
+        n_edges = (free[1:] & free[:-1]).sum() + (free[:, 1:] & free[:, :-1]).sum()
+        if n_edges != free.sum() - 1:
+            raise ValueError('Maze is not perfect')
+
+        # Root the tree
+        depth, moves = distances(maze, root)
+        self.cells = np.flatnonzero(free).astype(np.int32)
+        depth, moves = depth.reshape(-1)[self.cells], moves.reshape(-1)[self.cells]
+        if (depth == INF).any():
+            raise ValueError('Maze is not perfect')
+
+        # Parent is one move towards the root, the root points to itself
+        self.shape = maze.shape
+        self.root = root[0]*n_cols + root[1]
+        self.depth = depth
+        parent = self.cells.copy()
+        for move, change in steps(n_cols):
+            parent[moves == move] += change
+        parent = np.searchsorted(self.cells, parent).astype(np.int32)
+
+        # Ancestors 1, 2, 4, ... levels up
+        n_levels = max(1, int(depth.max()).bit_length())
+        self.up = np.empty((n_levels, len(self.cells)), dtype=np.int32)
+        self.up[0] = parent
+        for level in range(1, n_levels):
+            self.up[level] = self.up[level-1][self.up[level-1]]
+
+    def lca(self, a, b):
+        """
+        Find the lowest common ancestor of two cells.
+
+        Args:
+            a (tuple): (row, col) of the first cell.
+            b (tuple): (row, col) of the second cell.
+
+        Returns:
+            int: Flat index of the common ancestor.
+        """
+        return int(self.cells[self.__lca(self.__id(a), self.__id(b))])
+
+    def distance(self, a, b):
+        """
+        Compute the length of the path between two cells.
+
+        Args:
+            a (tuple): (row, col) of the first cell.
+            b (tuple): (row, col) of the second cell.
+
+        Returns:
+            int: Number of moves between the cells.
+        """
+        a, b = self.__id(a), self.__id(b)
+        return int(self.depth[a] + self.depth[b] - 2*self.depth[self.__lca(a, b)])
+
+    def path(self, a, b):
+        """
+        Find the path between two cells.
+
+        Args:
+            a (tuple): (row, col) of the first cell.
+            b (tuple): (row, col) of the second cell.
+
+        Returns:
+            Path: Path from `a` to `b`.
+        """
+        a, b = self.__id(a), self.__id(b)
+        ancestor = self.__lca(a, b)
+        parent = self.up[0]
+
+        # Climb from both cells to the ancestor
+        first, second = [a], [b]
+        while first[-1] != ancestor:
+            first.append(int(parent[first[-1]]))
+        while second[-1] != ancestor:
+            second.append(int(parent[second[-1]]))
+
+        return Path(self.cells[first + second[-2::-1]], self.shape)
+
+    def __lca(self, a, b):
+        """
+        Find the lowest common ancestor of two indexed cells.
+
+        Args:
+            a (int): Number of the first cell.
+            b (int): Number of the second cell.
+
+        Returns:
+            int: Number of the common ancestor.
+        """
+        if self.depth[a] < self.depth[b]:
+            a, b = b, a
+
+        # Lift the deeper cell to the same depth
+        diff = int(self.depth[a] - self.depth[b])
+        level = 0
+        while diff:
+            if diff & 1:
+                a = int(self.up[level][a])
+            diff >>= 1
+            level += 1
+
+        if a == b:
+            return a
+
+        # Lift both cells just below the ancestor
+        for level in range(len(self.up) - 1, -1, -1):
+            if self.up[level][a] != self.up[level][b]:
+                a, b = int(self.up[level][a]), int(self.up[level][b])
+        return int(self.up[0][a])
+
+    def __id(self, pos):
+        """
+        Convert a cell position to its number in the index.
+
+        Args:
+            pos (tuple): (row, col) of the cell.
+
+        Returns:
+            int: Number of the cell.
+
+        Raises:
+            ValueError: If the cell is not part of the maze.
+        """
+        cell = pos[0]*self.shape[1] + pos[1]
+        i = int(np.searchsorted(self.cells, cell))
+        if i == len(self.cells) or self.cells[i] != cell:
+            raise ValueError(f'Cell {tuple(pos)} is not part of the maze')
+        return i
+
+def solve(maze, screen=None, clock=None, start=None, goal=None, index=None):
+    """
+    Solve a perfect maze using the tree index.
+
+    Optionally display maze solution step on pygame screen.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+        screen (pygame.Surface, optional): Screen to draw maze. Defaults to None.
+        clock (pygame.time.Clock, optional): Clock controls the frame rate. Defaults to None.
+        start (tuple, optional): (row, col) of the start cell. Defaults to the top-left cell.
+        goal (tuple, optional): (row, col) of the goal cell. Defaults to the bottom-right cell.
+        index (TreeIndex, optional): Index of the maze built earlier. Defaults to None.
+
+    Returns:
+        Path: Path from the start to the goal, its `toGrid` gives the 2D array of directions.
+
+    Raises:
+        ValueError: If the maze is not perfect.
+    """
+    n_rows, n_cols = maze.shape
+    start = start or (1, 1)
+    goal = goal or (n_rows-2, n_cols-2)
+    index = index or TreeIndex(maze)
+
+    # Save path from start to end
+    path = index.path(start, goal)
+
+    # Visualize solution
+    if screen:
+        from maze.app.animation import animatePath
+        if not animatePath(screen, clock, maze, path, FPS):
+            return
+
+    return path
@@ -0,0 +1,169 @@
+"""
+Maze solver using value iteration.
+
+The moves of the mouse are deterministic and known from the maze, so the Q-values do not have to be
+learned by exploring. The best policy from every cell follows a shortest path to the cheese, so the
+value of a cell depends only on its distance d to the cheese:
+
+    V(d) = MOVE_COST * (1 + γ + ... + γ^(d-2)) + γ^(d-1) * WIN_PRIZE
+
+This module takes the distances of all cells from a single breadth-first search and fills the
+whole table of transitions in one pass of the Bellman optimality update:
+
+    Q(s, a) = reward(s, a) + γ * V(s')
+
+Walls and cells which cannot reach the cheese get a finite value below every other Q-value, so the
+table can be used as a fast solver, to validate learned policies or to warm start Q-learning.
+The plain iteration of the update over all states until nothing changes is kept in `sweep`
+to cross-check the result.
+It can optionally display the maze solution step-by-step using pygame.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+from maze.app.consts import WALL, INF, GAMMA, FPS, CRASH_PENALTY, MOVE_COST, WIN_PRIZE
+from maze.solution.env import transitions
+from maze.solution.qlearning import QTable
+import maze.solution.wavefront as wavefront
+import numpy as np
+
+def optimalTable(maze, goal=None, gamma=GAMMA):
+    """
+    Compute the optimal Q-values of a maze from the distances to the cheese.
+
+    Nothing is iterated: the values follow in closed form from a single breadth-first search,
+    which assumes that a shortest path to the cheese is the best policy. This holds for the
+    current rewards, where every move costs MOVE_COST < 0 and reaching the cheese pays WIN_PRIZE;
+    use `sweep` if the rewards change.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+        goal (tuple, optional): (row, col) of the cheese. Defaults to the bottom-right cell.
+        gamma (float, optional): Discount factor of future rewards. Defaults to GAMMA.
+
+    Returns:
+        QTable: Table of the optimal Q-values, see `floor` for cells which cannot reach the cheese.
+    """
+    n_rows, n_cols = maze.shape
+    goal = goal or (n_rows-2, n_cols-2)
+    next_state, reward, _, done = transitions(maze, goal)
+    dist = wavefront.distances(maze, goal)[0].reshape(-1)
+    reachable = dist != INF
+    lowest = floor(maze.shape, gamma)
+
+    # Value of moving along the shortest path, discounted once per move
+    d = dist.astype(np.float64) - 1
+    if gamma < 1:
+        discount = gamma ** d
+        value = MOVE_COST * (1 - discount) / (1 - gamma) + discount * WIN_PRIZE
+    else:
+        value = MOVE_COST * d + WIN_PRIZE
+    value[~reachable] = lowest
+
+    # Mouse on the cheese can only step away and come back
+    cheese = goal[0]*n_cols + goal[1]
+    value[cheese] = MOVE_COST + gamma * WIN_PRIZE if (dist == 1).any() else 0.0
+
+    # Bellman update of all states and actions, future reward is lost after reaching the cheese
+    qtable = QTable(maze.shape)
+    qtable.q_val = reward + gamma * np.where(done, 0.0, value[next_state])
+    qtable.q_val[~reachable] = lowest
+
+    return qtable
+
+def sweep(maze, goal=None, gamma=GAMMA, max_sweeps=None):
+    """
+    Compute the optimal Q-values of a maze by updating all states until nothing changes.
+
+    Q-values start at minus infinity and become finite once the cheese is within reach, so after
+    d sweeps all cells up to d moves from the cheese hold their final values. It is much slower
+    than `optimalTable` and meant to cross-check it.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+        goal (tuple, optional): (row, col) of the cheese. Defaults to the bottom-right cell.
+        gamma (float, optional): Discount factor of future rewards. Defaults to GAMMA.
+        max_sweeps (int, optional): Largest number of sweeps. Defaults to the number of cells.
+
+    Returns:
+        tuple: (qtable, n_sweeps)
+            - qtable (QTable): Table of the optimal Q-values, see `floor` for cells which cannot reach the cheese.
+            - n_sweeps (int): Number of sweeps made.
+    """
+    n_rows, n_cols = maze.shape
+    goal = goal or (n_rows-2, n_cols-2)
+    next_state, reward, _, done = transitions(maze, goal)
+    free = (maze != WALL).reshape(-1)
+
+    # Walls never get a value
+    reward = np.where(free[:, None], reward, -np.inf)
+
+    q_val = np.full((n_rows*n_cols, 4), -np.inf)
+    max_sweeps = max_sweeps or n_rows*n_cols
+    n_sweeps = 0
+
+    while n_sweeps < max_sweeps:
+        n_sweeps += 1
+
+        # Bellman update of all states and actions, future reward is lost after reaching the cheese
+        future = q_val.max(axis=1)[next_state]
+        update = reward + gamma * np.where(done, 0.0, future)
+        if np.array_equal(update, q_val):
+            break
+        q_val = update
+
+    # Cells out of reach of the cheese
+    q_val[~np.isfinite(q_val)] = floor(maze.shape, gamma)
+
+    qtable = QTable(maze.shape)
+    qtable.q_val = q_val
+    return qtable, n_sweeps
+
+def floor(shape, gamma=GAMMA):
+    """
+    Q-value of walls and cells which cannot reach the cheese.
+
+    It lies below every Q-value of a cell which can reach the cheese, even one that keeps crashing.
+
+    Args:
+        shape (tuple): (n_rows, n_cols) of the maze.
+        gamma (float, optional): Discount factor of future rewards. Defaults to GAMMA.
+
+    Returns:
+        float: Lowest Q-value of the table.
+    """
+    if gamma < 1:
+        return CRASH_PENALTY / (1 - gamma)
+    return CRASH_PENALTY * shape[0]*shape[1]
+
+def solve(maze, screen=None, clock=None, start=None, goal=None):
+    """
+    Solve a maze using value iteration.
+
+    Optionally display maze solution step on pygame screen.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+        screen (pygame.Surface, optional): Screen to draw maze. Defaults to None.
+        clock (pygame.time.Clock, optional): Clock controls the frame rate. Defaults to None.
+        start (tuple, optional): (row, col) of the start cell. Defaults to the top-left cell.
+        goal (tuple, optional): (row, col) of the goal cell. Defaults to the bottom-right cell.
+
+    Returns:
+        Path: Path from the start to the goal, its `toGrid` gives the 2D array of directions.
+    """
+    n_rows, n_cols = maze.shape
+    start = start or (1, 1)
+    goal = goal or (n_rows-2, n_cols-2)
+
+    # Save path from start to end, without discount far cells keep distinct values
+    qtable = optimalTable(maze, goal, gamma=1.0)
+    path = qtable.greedyPath(maze, start, goal)
+
+    # Visualize solution
+    if screen:
+        from maze.app.animation import animatePath
+        if not animatePath(screen, clock, maze, path, FPS):
+            return
+
+    return path
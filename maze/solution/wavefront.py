@@ -0,0 +1,113 @@
+"""
+Maze solver using a vectorized breadth-first search (BFS) wavefront.
+
+This module solves a maze by growing the wavefront from the goal one layer at a time. Every layer
+is computed with whole-array NumPy operations: the frontier cells are shifted in all four directions
+and combined with the mask of unreached free cells. The work per layer depends only on the size of the
+frontier, which makes the solver fast on open or braided mazes with wide frontiers.
+It can optionally display the maze solution step-by-step using pygame.
+
+Author: Michał Zientek
+Date: 2026-10-18
+"""
+from maze.app.consts import WALL, INF, FPS
+from maze.solution.path import Path, steps, trace
+import numpy as np
+
+def distances(maze, goal):
+    """
+    Compute the distance of every cell to the goal and the move leading towards it.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+        goal (tuple): (row, col) of the goal cell.
+
+    Returns:
+        tuple: (dist, moves)
+            - dist (np.ndarray): 2D int32 array of distances, INF for unreachable cells.
+            - moves (np.ndarray): 2D int8 array of moves towards the goal, -1 if there is none.
+    """
+    n_rows, n_cols = maze.shape
+    unreached = (maze != WALL).reshape(-1)
+    dist = np.full(n_rows*n_cols, INF, dtype=np.int32)
+    moves = np.full(n_rows*n_cols, -1, dtype=np.int8)
+
+    # Cell making a move reaches the frontier, so it lies in the opposite direction from it
+    layer_moves = np.array([move for move, _ in steps(n_cols)], dtype=np.int8)
+    changes = np.array([-change for _, change in steps(n_cols)], dtype=np.int64)
+
+    # Pick target node
+    frontier = np.array([goal[0]*n_cols + goal[1]], dtype=np.int64)
+    unreached[frontier] = False
+    dist[frontier] = 0
+    distance = 0
+
+    while len(frontier):
+        distance += 1
+
+        # Shift the frontier in all four directions and keep unreached free cells
+        layer = (changes[:, None] + frontier[None, :]).reshape(-1)
+        layer_move = np.repeat(layer_moves, len(frontier))
+        keep = unreached[layer]
+        layer, layer_move = layer[keep], layer_move[keep]
+
+        # Cells reached from several frontier cells take the first move
+        layer, first = np.unique(layer, return_index=True)
+        moves[layer] = layer_move[first]
+        dist[layer] = distance
+        unreached[layer] = False
+        frontier = layer
+
+    return dist.reshape(maze.shape), moves.reshape(maze.shape)
+
+def search(maze, start, goal):
+    """
+    Find the shortest path between two cells using a vectorized BFS wavefront.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+        start (tuple): (row, col) of the start cell.
+        goal (tuple): (row, col) of the goal cell.
+
+    Returns:
+        Path: Path from the start to the goal, empty if the goal is unreachable.
+    """
+    n_cols = maze.shape[1]
+    dist, moves = distances(maze, goal)
+
+    # Goal is unreachable
+    if dist[start[0], start[1]] == INF:
+        return Path([], maze.shape)
+
+    return Path(trace(moves.reshape(-1), start[0]*n_cols + start[1], n_cols), maze.shape)
+
+def solve(maze, screen=None, clock=None, start=None, goal=None):
+    """
+    Solve a maze using a vectorized BFS wavefront.
+
+    Optionally display maze solution step on pygame screen.
+
+    Args:
+        maze (np.ndarray): 2D array representing the maze.
+        screen (pygame.Surface, optional): Screen to draw maze. Defaults to None.
+        clock (pygame.time.Clock, optional): Clock controls the frame rate. Defaults to None.
+        start (tuple, optional): (row, col) of the start cell. Defaults to the top-left cell.
+        goal (tuple, optional): (row, col) of the goal cell. Defaults to the bottom-right cell.
+
+    Returns:
+        Path: Path from the start to the goal, its `toGrid` gives the 2D array of directions.
+    """
+    n_rows, n_cols = maze.shape
+    start = start or (1, 1)
+    goal = goal or (n_rows-2, n_cols-2)
+
+    # Save path from start to end
+    path = search(maze, start, goal)
+
+    # Visualize solution
+    if screen:
+        from maze.app.animation import animatePath
+        if not animatePath(screen, clock, maze, path, FPS):
+            return
+
+    return path